@@ -4,9 +4,14 @@
 
 import os
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 import vtk
-print(f"VTK has OpenGL support: {vtk.vtkRenderWindow().SupportsOpenGL()}")
+from vtk.util import numpy_support
 
 import pyvista as pv
 
@@ -17,14 +22,16 @@ def check_version_and_renderer():
 
     print(f"PyVista version: {pv.__version__}")
     print(f"VTK version: {pv.vtk_version_info}")
+    print(f"VTK has OpenGL support: {vtk.vtkRenderWindow().SupportsOpenGL()}")
 
-    # Create a simple plotter to check GPU info
-    p = pv.Plotter()
+    # Create a simple off-screen plotter to check GPU info
+    p = pv.Plotter(off_screen=True)
     print(f"Renderer: {p.renderer}")
     print(f"Render window: {p.render_window}")
 
-    # Try to get GPU info
-    p.show(auto_close=False)
+    # Render once synchronously to create the OpenGL context, no window needed.
+    # p.render() would do nothing as the plotter is never shown
+    p.render_window.Render()
     print(f"GPU Info: {p.render_window.ReportCapabilities()}")
     p.close()
 
@@ -46,161 +53,228 @@ class DamVisualization:
         self.plot_theme = 'dark'
         self.window_size = (1920, 1080)
         self.target_cells = 5_000_000  # Target number of cells for resampling
+        self.verbose = False  # Print per-frame diagnostics
+
+        # Cell locator shared by frames whose clipped mesh has the same topology
+        self._shared_topology = None
+        self._shared_locator = None
+        self._locator_lock = threading.Lock()
+
+        # Uniform grids keyed by (clipped bounds, target cells), reused across frames
+        self._uniform_grids = {}
 
     def find_vtk_files(self):
         """Load and sort VTK files from the data location"""
 
         print(f"Fiding VTK files in {self.data_location}...")
 
-        self.vtk_files = {}
+        self.vtk_files = dvu.find_vtk_files(self.data_location)
 
-        for file in os.listdir(self.data_location):
-            if file.startswith("dcinv") and file.endswith(".vtk"):
-                number = int(file.split('_')[-1].split('.')[0])
-                self.vtk_files[number] = file
+        print(f"Found {len(self.vtk_files)} VTK files.")
 
-        sorted_keys = sorted(self.vtk_files.keys())
-        self.vtk_files = {key: self.vtk_files[key] for key in sorted_keys}
+    def convert_to_vtu(self):
+        """One-time conversion of the legacy VTK files to binary .vtu files"""
 
-        print(f"Found {len(self.vtk_files)} VTK files.")
+        for key, filename in self.vtk_files.items():
+            if filename.endswith(".vtk"):
+                print(f"Converting {filename} to .vtu...")
+                dvu.convert_to_vtu(os.path.join(self.data_location, filename))
+
+        self.find_vtk_files()
 
     def print_mesh_info(self, mesh):
         """Print detailed information about the mesh and its data arrays"""
 
-        # Print basic mesh info
-        print("Mesh type:", type(mesh))
-        print("Number of points:", mesh.n_points)
-        print("Number of cells:", mesh.n_cells)
-        print("Mesh bounds:", mesh.bounds)
+        dvu.print_mesh_info(mesh)
 
-        # Check ALL data locations
-        print("\n=== POINT DATA ===")
-        print("Point data keys:", list(mesh.point_data.keys()))
-        print("Number of point arrays:", len(mesh.point_data))
+    def calculate_global_range(self):
+        """Calculate global min and max of "Resistivity(log10)" across all VTK files"""
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing as mp
 
-        print("\n=== CELL DATA ===") 
-        print("Cell data keys:", list(mesh.cell_data.keys()))
-        print("Number of cell arrays:", len(mesh.cell_data))
+        filenames = list(self.vtk_files.values())
+        file_paths = [os.path.join(self.data_location, filename) for filename in filenames]
 
-        print("\n=== FIELD DATA ===")
-        print("Field data keys:", list(mesh.field_data.keys()))
+        # Files are parsed independently, so run several VTK readers at once.
+        # Spawn instead of fork - forking a process with VTK loaded is unsafe.
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp.get_context('spawn')) as executor:
+            ranges = list(executor.map(dvu.file_scalar_range, file_paths,
+                                       ["Resistivity(log10)"] * len(file_paths)))
 
-        print("\n=== ACTIVE ARRAYS ===")
-        print("Active scalars:", mesh.active_scalars_name)
-        print("Active vectors:", mesh.active_vectors_name)
-        print("Active tensors:", mesh.active_tensors_name)
+        for filename, (current_min, current_max) in zip(filenames, ranges):
+            print(f"File {filename}: min={current_min:.3f}, max={current_max:.3f}")
 
-    def calculate_global_range(self):
-        """Calculate global min and max of "Resistivity(log10)" across all VTK files"""
-        global_min = float('inf')
-        global_max = float('-inf')
+        self.global_min = min((current_min for current_min, _ in ranges), default=float('inf'))
+        self.global_max = max((current_max for _, current_max in ranges), default=float('-inf'))
 
-        for key, filename in self.vtk_files.items():
-            file_path = os.path.join(self.data_location, filename)
+    def shared_cell_locator(self, clipped):
+        """Return a cell locator for the clipped mesh, reused while its topology is unchanged"""
+
+        topology = dvu.topology_hash(clipped)
+
+        with self._locator_lock:
+            if topology != self._shared_topology:
+                print("Mesh topology changed, building cell locator...")
+                self._shared_locator = dvu.build_cell_locator(clipped)
+                self._shared_topology = topology
+
+            return self._shared_locator
+
+    def shared_uniform_grid(self, clipped, target_cells):
+        """Return the uniform grid for the clipped mesh, built once per bounds and target"""
+
+        key = (tuple(clipped.bounds), target_cells)
+
+        # create_video prepares frames on several threads
+        with self._locator_lock:
+            if key not in self._uniform_grids:
+                self._uniform_grids[key] = dvu.create_uniform_grid(clipped.bounds, target_cells)
+
+            return self._uniform_grids[key]
+
+    def load_resampled(self, filename, bounds=None, target_cells=1_000_000, cleanup=False):
+        """Load, clip and resample a VTK file, reusing the on-disk cache when possible"""
+
+        if bounds is None:
+            bounds = self.bounds
+
+        file_path = os.path.join(self.data_location, filename)
+        cache_path = dvu.resample_cache_path(file_path, bounds, target_cells, cleanup)
+
+        if os.path.exists(cache_path):
+            resampled = pv.read(cache_path)
+            if "Resistivity(log10)" in resampled.point_data:
+                resampled.set_active_scalars("Resistivity(log10)")
+        else:
             mesh = pv.read(file_path)
             mesh.set_active_scalars("Resistivity(log10)")
-            
-            resistivity_data = mesh["Resistivity(log10)"]
-            current_min = resistivity_data.min()
-            current_max = resistivity_data.max()
-            
-            global_min = min(global_min, current_min)
-            global_max = max(global_max, current_max)
-            
-            print(f"File {filename}: min={current_min:.3f}, max={current_max:.3f}")
 
-        self.global_min = global_min
-        self.global_max = global_max
+            clipped = mesh.clip_box(bounds=bounds, invert=False)
+            locator = self.shared_cell_locator(clipped)
+            uniform_grid = self.shared_uniform_grid(clipped, target_cells)
+
+            if cleanup:
+                resampled = dvu.resample_to_uniform_grid_with_cleanup(clipped, target_cells=target_cells,
+                                                                       locator=locator, verbose=self.verbose,
+                                                                       uniform_grid=uniform_grid)
+            else:
+                resampled = dvu.resample_to_uniform_grid(clipped, target_cells=target_cells,
+                                                         locator=locator, verbose=self.verbose,
+                                                         uniform_grid=uniform_grid)
+
+            # The resampled grid keeps the clipped mesh's active scalars
+            dvu.save_to_cache(resampled, cache_path)
+
+        return resampled
 
     def create_video(self):
-        """Create video by actually showing the window for each frame"""
-        import imageio
-        import time
+        """Create video by rendering all frames through a single plotter"""
         
         if self.global_min is None or self.global_max is None:
             raise ValueError("Global min and max must be calculated before creating video.")
 
         pv.set_plot_theme(self.plot_theme)
         
-        frames = []
-        camera_position = None
+        # One plotter for the whole movie - avoids rebuilding the OpenGL
+        # context and shaders for every frame
+        plotter = pv.Plotter(window_size=self.window_size, off_screen=True)
+        
+        # Stream frames to the encoder - only one frame is held in memory
+        width, height = self.window_size
+        writer = dvu.open_video_writer(self.movie_filename, width, height, fps=10)
         
+        # Preallocated readback buffer shared with a VTK array, so the
+        # render window writes RGB pixels straight into numpy memory. The
+        # flipped frame is copied into a second buffer so the encoder gets
+        # contiguous data without any per-frame allocation.
+        pixel_buffer = np.empty((width * height, 3), dtype=np.uint8)
+        vtk_pixels = numpy_support.numpy_to_vtk(pixel_buffer, deep=False,
+                                                array_type=vtk.VTK_UNSIGNED_CHAR)
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        
+        def prepare_frame(filename):
+            # Quantize to uint8 over the global range - 8x less data to upload
+            # than float64 and the mapper does not need to convert it
+            resampled = self.load_resampled(filename)
+            resampled["Resistivity_u8"] = dvu.quantize_to_uint8(
+                resampled["Resistivity(log10)"], self.global_min, self.global_max)
+            resampled.set_active_scalars("Resistivity_u8")
+            return resampled
+        
+        # Load and resample upcoming frames on worker threads while the
+        # current one is rendered and encoded (VTK I/O releases the GIL)
+        frames = list(self.vtk_files.items())
+        prefetch_depth = 2
+        pool = ThreadPoolExecutor(max_workers=prefetch_depth)
+        futures = deque(pool.submit(prepare_frame, filename)
+                        for _, filename in frames[:prefetch_depth])
+        
+        try:
+            mapper = None
+            text_actor = None
 
-        for key, filename in self.vtk_files.items():
-            print(f"Processing frame {key} for {filename}...")
-            
-            # Create COMPLETELY FRESH plotter for each frame
-            plotter = pv.Plotter(window_size=self.window_size)
-            
-            # Load mesh
-            file_path = os.path.join(self.data_location, filename)
-            mesh = pv.read(file_path)
-            mesh.set_active_scalars("Resistivity(log10)")
-            
-            # Process
-            clipped = mesh.clip_box(bounds=self.bounds, invert=False)
-            resampled = dvu.resample_to_uniform_grid(clipped)
-            resampled.set_active_scalars('Resistivity(log10)')
-            
-            # Add volume
-            plotter.add_volume(
-                resampled, 
-                cmap='RdYlBu_r', 
-                opacity=self.opacity, 
-                shade=True,
-                clim=[self.global_min, self.global_max]
-            )
-            
-            if self.show_bounds:
-                plotter.show_bounds(location='outer', all_edges=True)
+            for i, (key, filename) in enumerate(frames):
+                print(f"Processing frame {key} for {filename}...")
             
-            plotter.add_text(f"Time Step: {key}", position='upper_left', font_size=10)
+                resampled = futures.popleft().result()
+                if i + prefetch_depth < len(frames):
+                    futures.append(pool.submit(prepare_frame, frames[i + prefetch_depth][1]))
             
-            # Set camera with exact parameters
-            if camera_position is None:
-                # First frame - set camera and save all parameters
-                #plotter.camera_position = 'iso'
-                #plotter.camera.zoom(1.5)
+                if mapper is None:
+                    # First frame - build the scene
+                    vol_actor = plotter.add_volume(
+                        resampled, 
+                        cmap='RdYlBu_r', 
+                        opacity=self.opacity, 
+                        shade=True,
+                        clim=[0, 255],
+                        mapper='gpu',
+                        scalar_bar_args={'title': 'Resistivity(log10)'}
+                    )
+                    mapper = vol_actor.mapper
+                    
+                    # Volume colors were built from the 0-255 range, label the
+                    # scalar bar in data units
+                    plotter.scalar_bar.GetLookupTable().SetRange(self.global_min, self.global_max)
+                    
+                    # Fixed sample distance of half a voxel, jittering hides
+                    # the stepping artifacts
+                    mapper.SetBlendModeToComposite()
+                    mapper.SetAutoAdjustSampleDistances(False)
+                    mapper.SetSampleDistance(float(min(resampled.spacing)) * 0.5)
+                    mapper.UseJitteringOn()
                 
-                # Save complete camera state
-                camera_position = plotter.camera.position
-                camera_focal_point = plotter.camera.focal_point
-                #camera_view_up = plotter.camera.view_up
+                    if self.show_bounds:
+                        plotter.show_bounds(location='outer', all_edges=True)
                 
-                print(f"Camera position: {camera_position}")
-                print(f"Camera focal point: {camera_focal_point}")
-                #print(f"Camera view up: {camera_view_up}")
-            else:
-                # Subsequent frames - set exact same camera parameters
-                plotter.camera.position = camera_position
-                plotter.camera.focal_point = camera_focal_point
-                #plotter.camera.view_up = camera_view_up
-            
-            # CRITICAL: Actually show the window to force proper GPU rendering
-            plotter.show(auto_close=False, interactive=False, interactive_update=False)
-            
-            # Give GPU time to complete rendering
-            time.sleep(0.3)
+                    text_actor = plotter.add_text(f"Time Step: {key}", position='upper_left', font_size=10)
+                
+                    # plotter.render() is a no-op until the plotter has been shown, so the
+                    # camera is fitted here and the window rendered directly below
+                    plotter.reset_camera()
+                
+                    if self.verbose:
+                        print(f"Camera position: {plotter.camera.position}")
+                        print(f"Camera focal point: {plotter.camera.focal_point}")
+                else:
+                    # Subsequent frames - only swap the dataset on the existing mapper
+                    mapper.SetInputData(resampled)
+                    text_actor.SetText(2, f"Time Step: {key}")  # 2 = upper left corner
             
-            # Now capture screenshot
-            img = plotter.screenshot(return_img=True)
-            frames.append(img)
+                # Render synchronously and read back the front buffer directly
+                plotter.render_window.Render()
+                plotter.render_window.GetPixelData(0, 0, width - 1, height - 1, 1, vtk_pixels)
             
-            # Close plotter
+                # OpenGL rows start at the bottom
+                np.copyto(frame, pixel_buffer.reshape(height, width, 3)[::-1])
+                writer.write_frame(frame)
+
+        finally:
+            pool.shutdown(cancel_futures=True)
+            # Frames are streamed, so closing flushes the encoder
+            writer.close()
             plotter.close()
-            del plotter
-
-        
-        # Combine frames into video
-        print(f"\nCombining {len(frames)} frames into video...")
-        imageio.mimsave(
-            self.movie_filename,
-            frames,
-            fps=10,
-            codec='libx264',
-            quality=8,
-            pixelformat='yuv420p'
-        )
         
         print(f"Video saved as {self.movie_filename}") 
 
@@ -210,26 +284,19 @@ class DamVisualization:
 
         pv.set_plot_theme(self.plot_theme)
 
-        file_path = os.path.join(self.data_location, self.vtk_files[frame_index])
-        mesh = pv.read(file_path)
-        mesh.set_active_scalars("Resistivity(log10)")
-        
-        clipped = mesh.clip_box(bounds=(2, 17, 2, 22, 22, 27), invert=False)
-
-        resampled = dvu.resample_to_uniform_grid_with_cleanup(clipped, target_cells=self.target_cells)
+        resampled = self.load_resampled(self.vtk_files[frame_index], bounds=(2, 17, 2, 22, 22, 27),
+                                        target_cells=self.target_cells, cleanup=True)
 
         # Check what arrays exist
-        print(f"Available point arrays: {resampled.point_data.keys()}")
+        if self.verbose:
+            print(f"Available point arrays: {resampled.point_data.keys()}")
 
-        # Set the active scalars (replace 'your_array_name' with actual name)
-        if len(resampled.point_data.keys()) > 0:
-            resampled.set_active_scalars('Resistivity(log10)')
-        else:
+        if len(resampled.point_data.keys()) == 0:
             print("ERROR: No point data arrays found!")        
 
         p = pv.Plotter(window_size=self.window_size)
         p.add_volume(resampled, cmap='RdYlBu_r', opacity=self.opacity, shade=True,
-                    clim=[self.global_min, self.global_max])
+                    clim=[self.global_min, self.global_max], mapper='gpu')
         
         p.show_bounds(location='outer', all_edges=True)
         p.add_text(f"Interactive View: {self.vtk_files[frame_index]}", position='upper_left', font_size=16)
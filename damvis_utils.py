@@ -1,32 +1,254 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+import re
+import hashlib
+import json
+from fractions import Fraction
+
+from vtkmodules.vtkCommonCore import vtkPoints, vtkSMPTools
+from vtkmodules.vtkCommonDataModel import vtkCellLocatorStrategy, vtkStaticCellLocator
+from vtkmodules.vtkFiltersCore import vtkProbeFilter
+from vtkmodules.vtkIOLegacy import vtkGenericDataObjectReader
+from vtkmodules.vtkIOXML import vtkXMLUnstructuredGridReader
+from vtkmodules.util import numpy_support
 import pyvista as pv
 import numpy as np
 
-def resample_to_uniform_grid(ugrid, target_cells=1_000_000):
+# Threaded backend for vtkSMPTools (static cell locator build and probing).
+# Silently stays on the default backend if VTK was built without TBB.
+vtkSMPTools.SetBackend('TBB')
+
+# On-disk cache for resampled uniform grids. Bump CACHE_VERSION whenever
+# the resampling changes so stale grids are not reused.
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'damvis')
+CACHE_VERSION = 4
+
+# Frame files are named like dcinv.result_<frame>.vtk
+VTK_FILE_PATTERN = re.compile(r"^dcinv.*_(\d+)\.vtk$")
+
+# Uniform grid point counts are rounded up to multiples of this, matching GPU 3D texture
+# tiles, as long as that adds at most GRID_ALIGNMENT_MAX_INFLATION of the axis' points.
+# Thin axes keep their count, aligning them would multiply the voxels and skew the spacing
+GRID_ALIGNMENT = 16
+GRID_ALIGNMENT_MAX_INFLATION = 0.1
+
+# Values quantized per block in quantize_to_uint8, 1 MB of float32 scratch that stays in cache
+QUANTIZE_BLOCK = 1 << 18
+
+def find_vtk_files(data_location):
     """
-    Resample unstructured grid to uniform grid with approximate target cell count.
+    Return {frame number: filename} of the frame files in data_location, sorted by frame.
+    
+    If a frame has a converted .vtu sibling (see convert_to_vtu) it is used
+    instead of the legacy .vtk file, as binary XML is much faster to parse.
+    """
+    with os.scandir(data_location) as entries:
+        names = {entry.name for entry in entries}
+    
+    pairs = []
+    for name in names:
+        m = VTK_FILE_PATTERN.match(name)
+        if m:
+            vtu_name = name[:-4] + ".vtu"
+            pairs.append((int(m.group(1)), vtu_name if vtu_name in names else name))
+    pairs.sort()
+    return dict(pairs)
+
+def convert_to_vtu(file_path):
+    """Convert a legacy .vtk file to a compressed binary .vtu sibling and return its path"""
+    vtu_path = file_path[:-4] + ".vtu"
+    if not os.path.exists(vtu_path) or os.path.getmtime(vtu_path) < os.path.getmtime(file_path):
+        pv.read(file_path).save(vtu_path, binary=True)
+    return vtu_path
+
+def read_mesh(file_path, scalar_name=None):
+    """
+    Read a frame file, loading only the scalar_name array from legacy .vtk files.
+    
+    Skipping the other scalars, vectors, tensors and field data of a legacy
+    file cuts parse time and memory roughly in proportion to the number of
+    arrays. Converted .vtu files (see convert_to_vtu) are read with the other
+    arrays deselected the same way. Other formats, or scalar_name=None, read
+    everything via pv.read.
+    """
+    if scalar_name is not None and file_path.endswith(".vtu"):
+        # XML readers only decode the arrays enabled in their selections
+        reader = vtkXMLUnstructuredGridReader()
+        reader.SetFileName(file_path)
+        reader.UpdateInformation()
+        for selection in (reader.GetPointDataArraySelection(), reader.GetCellDataArraySelection()):
+            selection.DisableAllArrays()
+            selection.EnableArray(scalar_name)
+        reader.Update()
+        return pv.wrap(reader.GetOutput())
+    
+    if scalar_name is None or not file_path.endswith(".vtk"):
+        return pv.read(file_path)
+    
+    reader = vtkGenericDataObjectReader()
+    reader.SetFileName(file_path)
+    reader.ReadAllScalarsOff()
+    reader.ReadAllVectorsOff()
+    reader.ReadAllTensorsOff()
+    reader.ReadAllNormalsOff()
+    reader.ReadAllTCoordsOff()
+    reader.ReadAllFieldsOff()
+    reader.SetScalarsName(scalar_name)
+    reader.Update()
+    return pv.wrap(reader.GetOutput())
+
+def print_mesh_info(mesh):
+    """Print detailed information about the mesh and its data arrays"""
+
+    # Print basic mesh info
+    print("Mesh type:", type(mesh))
+    print("Number of points:", mesh.n_points)
+    print("Number of cells:", mesh.n_cells)
+    print("Mesh bounds:", mesh.bounds)
+
+    # Check ALL data locations
+    print("\n=== POINT DATA ===")
+    print("Point data keys:", list(mesh.point_data.keys()))
+    print("Number of point arrays:", len(mesh.point_data))
+
+    print("\n=== CELL DATA ===") 
+    print("Cell data keys:", list(mesh.cell_data.keys()))
+    print("Number of cell arrays:", len(mesh.cell_data))
+
+    print("\n=== FIELD DATA ===")
+    print("Field data keys:", list(mesh.field_data.keys()))
+
+    print("\n=== ACTIVE ARRAYS ===")
+    print("Active scalars:", mesh.active_scalars_name)
+    print("Active vectors:", mesh.active_vectors_name)
+    print("Active tensors:", mesh.active_tensors_name)
+
+def scalar_range(mesh, name):
+    """Return (min, max) of a point or cell array, ignoring NaN values"""
+    src = np.asarray(mesh[name])
+    return float(np.nanmin(src)), float(np.nanmax(src))
+
+def file_scalar_range(file_path, name):
+    """Read one array of a VTK file and return its (min, max)"""
+    return scalar_range(read_mesh(file_path, name), name)
+
+def topology_hash(ugrid):
+    """Hash of the points and cells of a grid, equal for grids with identical geometry"""
+    digest = hashlib.sha1()
+    digest.update(np.ascontiguousarray(ugrid.points).tobytes())
+    digest.update(np.ascontiguousarray(ugrid.cells).tobytes())
+    digest.update(np.ascontiguousarray(ugrid.celltypes).tobytes())
+    return digest.hexdigest()
+
+def build_cell_locator(ugrid):
+    """
+    Build a vtkStaticCellLocator that can be shared by grids with the same topology.
+    
+    The locator never rebuilds itself, so it can be attached to other grids
+    with identical points and cells (see probe_uniform_grid).
+    """
+    locator = vtkStaticCellLocator()
+    locator.SetDataSet(ugrid)
+    locator.BuildLocator()
+    locator.UseExistingSearchStructureOn()
+    return locator
+
+def float32_points(ugrid):
+    """
+    Return the points of ugrid as single precision vtkPoints.
+    
+    Like a locator from build_cell_locator, the result can be shared by
+    grids with the same topology (see probe_uniform_grid).
+    """
+    # The converted array is handed to VTK without another copy, numpy_to_vtk
+    # keeps a reference to it for the lifetime of the VTK array
+    points32 = np.ascontiguousarray(ugrid.points, dtype=np.float32)
+    vtk_points = vtkPoints()
+    vtk_points.SetData(numpy_support.numpy_to_vtk(points32, deep=False))
+    return vtk_points
+
+def probe_uniform_grid(uniform_grid, ugrid, locator=None, points=None):
+    """
+    Interpolate the active scalars of ugrid onto the points of uniform_grid.
+    
+    If ugrid has no active scalars, all of its arrays are interpolated.
+    Uses vtkProbeFilter with a vtkStaticCellLocator, which is built and
+    queried in parallel through vtkSMPTools. A prebuilt locator from
+    build_cell_locator and float32 points from float32_points are reused
+    instead of building new ones.
+    """
+    # Only interpolate the active array - probing costs per array per voxel.
+    # The probe output keeps the source array type, so handing it float32
+    # keeps the resampled volume float32 end-to-end (half the bytes of float64).
+    source = ugrid
+    name = ugrid.active_scalars_name
+    if name is not None:
+        source = ugrid.__class__()
+        source.copy_structure(ugrid)
+        if name in ugrid.point_data:
+            source.point_data[name] = np.asarray(ugrid.point_data[name], dtype=np.float32)
+        else:
+            source.cell_data[name] = np.asarray(ugrid.cell_data[name], dtype=np.float32)
+        source.set_active_scalars(name)
+        
+        # float32 points halve the bytes the locator and probe walk through;
+        # plenty of precision for coordinates in meters
+        if points is not None:
+            source.SetPoints(points)
+        elif source.points.dtype != np.float32:
+            source.SetPoints(float32_points(source))
+    
+    probe = vtkProbeFilter()
+    probe.SetInputData(uniform_grid)
+    probe.SetSourceData(source)
+    if locator is not None:
+        # Attached to the source, the strategy uses the locator as it is
+        source.SetCellLocator(locator)
+        probe.SetFindCellStrategy(vtkCellLocatorStrategy())
+    else:
+        # The probe instantiates and builds its own locator from the prototype
+        probe.SetCellLocatorPrototype(vtkStaticCellLocator())
+    probe.Update()
+    
+    resampled = pv.wrap(probe.GetOutput())
+    if ugrid.active_scalars_name in resampled.point_data:
+        resampled.set_active_scalars(ugrid.active_scalars_name)
+    
+    return resampled
+
+def create_uniform_grid(bounds, target_cells=1_000_000):
+    """
+    Create an empty uniform grid spanning bounds with approximate target cell count.
+    
+    The bounds should be the tight bounds of the clipped mesh, so no voxels
+    are spent on empty space around it. Point counts are rounded up to a
+    multiple of GRID_ALIGNMENT where that inflates an axis by at most
+    GRID_ALIGNMENT_MAX_INFLATION, and the spacing of that axis is stretched
+    to cover the bounds exactly. The real cell count is the grid's n_cells,
+    up to about a third above target_cells in the worst case.
     """
-    bounds = ugrid.bounds
     extents = [
         bounds[1] - bounds[0],
         bounds[3] - bounds[2],
         bounds[5] - bounds[4]
     ]
     
+    if min(extents) <= 0:
+        raise ValueError(f"Cannot resample empty or flat bounds: {bounds}")
+    
     # Calculate dimensions maintaining aspect ratio
     volume = extents[0] * extents[1] * extents[2]
     cell_size = (volume / target_cells) ** (1/3)
     
-    dimensions = [
-        int(np.ceil(extents[0] / cell_size)) + 1,
-        int(np.ceil(extents[1] / cell_size)) + 1,
-        int(np.ceil(extents[2] / cell_size)) + 1
-    ]
+    dimensions = []
+    for extent in extents:
+        n_points = int(np.ceil(extent / cell_size)) + 1
+        aligned = -(-n_points // GRID_ALIGNMENT) * GRID_ALIGNMENT
+        dimensions.append(aligned if aligned - n_points <= GRID_ALIGNMENT_MAX_INFLATION * n_points else n_points)
     
-    # Create uniform grid
-    uniform_grid = pv.ImageData(
+    return pv.ImageData(
         dimensions=dimensions,
         spacing=[
             extents[0] / (dimensions[0] - 1),
@@ -35,83 +257,206 @@ def resample_to_uniform_grid(ugrid, target_cells=1_000_000):
         ],
         origin=(bounds[0], bounds[2], bounds[4])
     )
+
+def resample_to_uniform_grid(ugrid, target_cells=1_000_000, locator=None, verbose=False,
+                             uniform_grid=None, points=None):
+    """
+    Resample unstructured grid to uniform grid with approximate target cell count.
+    
+    An optional prebuilt cell locator and float32 points for ugrid's
+    topology are passed on to probe_uniform_grid, and a precomputed
+    uniform_grid from create_uniform_grid is used instead of building a new
+    one. Diagnostics are only printed when verbose is set.
+    """
+    if uniform_grid is None:
+        uniform_grid = create_uniform_grid(ugrid.bounds, target_cells)
+    dimensions = list(uniform_grid.dimensions)
     
     # Check what arrays are available
-    print(f"Available arrays: {ugrid.array_names}")
+    if verbose:
+        print(f"Available arrays: {ugrid.array_names}")
     
     # Resample - this will interpolate all point data
-    resampled = uniform_grid.sample(ugrid)
+    resampled = probe_uniform_grid(uniform_grid, ugrid, locator=locator, points=points)
     
-    print(f"Resampled dimensions: {dimensions}")
-    print(f"Total cells: {resampled.n_cells}")
-    print(f"Resampled arrays: {resampled.array_names}")
+    if verbose:
+        print(f"Resampled dimensions: {dimensions}")
+        print(f"Total cells: {resampled.n_cells}")
+        print(f"Resampled arrays: {resampled.array_names}")
     
     return resampled
 
-def resample_to_uniform_grid_with_cleanup(ugrid, target_cells=1_000_000):
+def resample_to_uniform_grid_with_cleanup(ugrid, target_cells=1_000_000, locator=None, verbose=False,
+                                          uniform_grid=None):
     """Resample with artifact cleanup"""
-    import numpy as np
-    
-    bounds = ugrid.bounds
-    extents = [
-        bounds[1] - bounds[0],
-        bounds[3] - bounds[2],
-        bounds[5] - bounds[4]
-    ]
-    
-    volume = extents[0] * extents[1] * extents[2]
-    cell_size = (volume / target_cells) ** (1/3)
-    
-    dimensions = [
-        int(np.ceil(extents[0] / cell_size)) + 1,
-        int(np.ceil(extents[1] / cell_size)) + 1,
-        int(np.ceil(extents[2] / cell_size)) + 1
-    ]
+    if uniform_grid is None:
+        uniform_grid = create_uniform_grid(ugrid.bounds, target_cells)
+    dimensions = list(uniform_grid.dimensions)
     
     # Ensure input has point data
     if ugrid.active_scalars_name in ugrid.cell_data:
         ugrid = ugrid.cell_data_to_point_data()
     
-    uniform_grid = pv.ImageData(
-        dimensions=dimensions,
-        spacing=[
-            extents[0] / (dimensions[0] - 1),
-            extents[1] / (dimensions[1] - 1),
-            extents[2] / (dimensions[2] - 1)
-        ],
-        origin=(bounds[0], bounds[2], bounds[4])
-    )
-    
     # Resample
-    resampled = uniform_grid.sample(ugrid)
+    resampled = probe_uniform_grid(uniform_grid, ugrid, locator=locator)
     
     # CRITICAL: Clean up the resampled data
     if resampled.active_scalars_name:
-        data = resampled[resampled.active_scalars_name].copy()
-        
-        # Replace NaN and Inf values
-        nan_mask = np.isnan(data) | np.isinf(data)
-        if nan_mask.any():
-            print(f"  Replacing {nan_mask.sum()} NaN/Inf values")
-            # Use a value outside your data range or minimum value
-            data[nan_mask] = np.nanmin(data) - 1.0  # or use 0.0
+        # View on the VTK array - edited in place, no copy
+        data = resampled[resampled.active_scalars_name]
         
         # Threshold: remove values that are clearly artifacts
         # (values significantly outside the expected range)
-        valid_min = ugrid[ugrid.active_scalars_name].min()
-        valid_max = ugrid[ugrid.active_scalars_name].max()
+        valid_min, valid_max = scalar_range(ugrid, ugrid.active_scalars_name)
         
         # Add small buffer for interpolation
         buffer = (valid_max - valid_min) * 0.1
-        artifact_mask = (data < valid_min - buffer) | (data > valid_max + buffer)
-        if artifact_mask.any():
-            print(f"  Removing {artifact_mask.sum()} out-of-range values")
+        
+        # NaN fails both comparisons and Inf is outside the finite bounds,
+        # so a single range mask catches every kind of artifact
+        artifact_mask = ~((data >= valid_min - buffer) & (data <= valid_max + buffer))
+        n_artifacts = np.count_nonzero(artifact_mask)
+        if n_artifacts:
+            if verbose:
+                print(f"  Replacing {n_artifacts} NaN/Inf/out-of-range values")
             data[artifact_mask] = valid_min - 1.0
+    
+    if verbose:
+        print(f"Resampled dimensions: {dimensions}")
+        print(f"Total cells: {resampled.n_cells}")
+    
+    return resampled
+
+class VideoWriter:
+    """
+    Streaming H.264 writer on PyAV, opened with open_video_writer.
+    
+    Frames are added with write_frame(rgb_array) and close() flushes the
+    encoder and finishes the file.
+    """
+    
+    def __init__(self, container, stream):
+        self.container = container
+        self.stream = stream
+    
+    def write_frame(self, rgb):
+        """Encode one (height, width, 3) uint8 RGB frame"""
+        import av
         
-        # Update the resampled data
-        resampled[resampled.active_scalars_name] = data
+        frame = av.VideoFrame.from_ndarray(rgb, format="rgb24")
+        self.container.mux(self.stream.encode(frame))
+    
+    def close(self):
+        """Flush the encoder and close the file"""
+        self.container.mux(self.stream.encode(None))
+        self.container.close()
+
+def nvenc_available():
+    """
+    Return True if h264_nvenc can actually be opened.
+    
+    FFmpeg builds often include NVENC without an NVIDIA GPU or driver to run
+    it, which only shows when an encoder is opened, so a small one is tried.
+    """
+    import av
+    
+    try:
+        context = av.CodecContext.create("h264_nvenc", "w")
+        context.width = 256
+        context.height = 256
+        context.pix_fmt = "yuv420p"
+        context.time_base = Fraction(1, 25)
+        context.open()
+    except (ValueError, OSError, av.FFmpegError):
+        return False
+    return True
+
+def open_video_writer(filename, width, height, fps=10):
+    """
+    Open a streaming H.264 video writer, encoding on the GPU (NVENC) when available.
+    
+    Falls back to CPU libx264 if NVENC cannot be opened on this machine. Both
+    write yuv420p, libx264 at CRF 10 (imageio's quality=8).
+    """
+    import av
     
-    print(f"Resampled dimensions: {dimensions}")
-    print(f"Total cells: {resampled.n_cells}")
+    container = av.open(filename, mode="w")
     
-    return resampled
\ No newline at end of file
+    if nvenc_available():
+        stream = container.add_stream("h264_nvenc", rate=fps,
+                                      options={"preset": "p4", "rc": "vbr", "cq": "23"})
+        print("Encoding video with h264_nvenc")
+    else:
+        stream = container.add_stream("libx264", rate=fps, options={"crf": "10"})
+        print("NVENC not available, encoding video with libx264")
+    stream.width = width
+    stream.height = height
+    stream.pix_fmt = "yuv420p"
+    
+    return VideoWriter(container, stream)
+
+def quantize_to_uint8(data, vmin, vmax, out=None):
+    """
+    Linearly map data from [vmin, vmax] to 0-255, clipping values outside the range.
+    
+    The result is written to out if given. Data is scaled in blocks of
+    QUANTIZE_BLOCK values through a small float32 scratch buffer, so no
+    float32 copy of the whole volume is made on the way to uint8. An empty
+    range (vmax <= vmin) is widened to one unit above vmin, and a range
+    that is not finite raises ValueError.
+    """
+    if not (np.isfinite(vmin) and np.isfinite(vmax)):
+        raise ValueError(f"Cannot quantize over a non-finite range: [{vmin}, {vmax}]")
+    
+    data = np.ravel(data)
+    if out is None:
+        out = np.empty(data.shape, dtype=np.uint8)
+    flat_out = out.reshape(-1)
+    
+    span = vmax - vmin if vmax > vmin else 1.0
+    scale = 255.0 / span
+    scratch = np.empty(min(data.size, QUANTIZE_BLOCK), dtype=np.float32)
+    for start in range(0, data.size, QUANTIZE_BLOCK):
+        block = data[start:start + QUANTIZE_BLOCK]
+        scaled = scratch[:block.size]
+        np.subtract(block, vmin, out=scaled, dtype=np.float32)
+        scaled *= scale
+        np.nan_to_num(scaled, copy=False, nan=0.0)
+        np.clip(scaled, 0.0, 255.0, out=scaled)
+        np.copyto(flat_out[start:start + block.size], scaled, casting='unsafe')
+    return out
+
+def slab_value_ranges(volume):
+    """
+    Return the (min, max) values of every slab of a 3D (z, y, x) array along x, y and z.
+    
+    Each reduction runs over the array in place, so no voxel-sized temporaries are
+    created. A slab can only contain values inside its range, which is enough to
+    decide conservatively whether it holds anything visible.
+    """
+    return [(volume.min(axis=axes), volume.max(axis=axes)) for axes in ((0, 1), (0, 2), (1, 2))]
+
+def resample_cache_path(file_path, bounds, target_cells, cleanup=False):
+    """
+    Return the cache file for a resampled VTK file.
+    
+    The key covers everything the resampled grid depends on, including the
+    source file's modification time, so edited files are resampled again.
+    """
+    st = os.stat(file_path)
+    key = hashlib.sha1(json.dumps({
+        "version": CACHE_VERSION,
+        "file": os.path.abspath(file_path),
+        "mtime": st.st_mtime,
+        "bounds": [float(b) for b in bounds],
+        "target": int(target_cells),
+        "cleanup": cleanup
+    }).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.vti")
+
+def save_to_cache(grid, cache_path):
+    """Write a grid to the cache, atomically so readers never see partial files"""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path[:-4]}.{os.getpid()}.tmp.vti"
+    grid.save(tmp_path)
+    os.replace(tmp_path, cache_path)
@@ -4,6 +4,12 @@
 
 import sys
 import os
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import methodcaller
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QGridLayout, QSlider, QLabel, QPushButton, 
@@ -11,15 +17,158 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QFileDialog, QMessageBox, QCheckBox, QProgressBar,
                             QSplitter, QFrame, QRadioButton)
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont, QPalette
 
-import vtk
-from vtk.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+# Only the VTK modules in use are loaded instead of all of VTK. The OpenGL, volume OpenGL,
+# FreeType and interaction style modules register the implementations behind the
+# rendering, text and interactor classes
+import vtkmodules.vtkInteractionStyle  # noqa: F401
+import vtkmodules.vtkRenderingFreeType  # noqa: F401
+import vtkmodules.vtkRenderingOpenGL2  # noqa: F401
+import vtkmodules.vtkRenderingVolumeOpenGL2  # noqa: F401
+from vtkmodules.vtkCommonCore import VTK_UNSIGNED_CHAR
+from vtkmodules.vtkCommonDataModel import vtkImageData, vtkPiecewiseFunction
+from vtkmodules.vtkFiltersCore import vtkQuadricClustering
+from vtkmodules.vtkFiltersGeometry import vtkGeometryFilter
+from vtkmodules.vtkIOImage import vtkPNGWriter
+from vtkmodules.vtkRenderingAnnotation import vtkCubeAxesActor, vtkScalarBarActor
+from vtkmodules.vtkRenderingCore import (vtkActor, vtkColorTransferFunction, vtkLight, vtkPolyDataMapper,
+                                         vtkRenderer, vtkVolume, vtkVolumeProperty, vtkWindowToImageFilter)
+from vtkmodules.vtkRenderingLOD import vtkLODActor
+from vtkmodules.vtkRenderingVolume import vtkGPUVolumeRayCastMapper
+from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+from vtkmodules.util import numpy_support
 import pyvista as pv
 
 import damvis_utils as dvu
 
+logger = logging.getLogger(__name__)
+
+
+# Reads .value() of a slider or spinbox, for mapping over widget lists
+_value = methodcaller('value')
+
+# Maximum number of resampled frames kept in memory
+FRAME_CACHE_SIZE = 32
+
+# Maximum number of frame meshes, as read from disk, kept in memory, and the memory they
+# may take together in KiB. Fine meshes hit the memory budget before the count
+MESH_CACHE_SIZE = 16
+MESH_CACHE_MEMORY_KB = 2 * 1024 * 1024
+
+# Number of frames on each side of the current one read ahead in the background
+PREFETCH_FRAMES = 2
+
+# Frame rates VTK aims for while the view is moved or scrubbed, and once it comes to rest.
+# Level of detail actors pick their detail from the time allotted
+INTERACTIVE_UPDATE_RATE = 30.0
+STILL_UPDATE_RATE = 0.001
+
+# Isosurfaces with more cells than this get a decimated level of detail for interaction,
+# clustered onto a grid with this many divisions along each axis
+ISO_LOD_MIN_CELLS = 50000
+ISO_LOD_DIVISIONS = 64
+
+# Colormap stops as rows of (fraction of data range, r, g, b)
+COLORMAP_STOPS = {
+    # Red-Yellow-Blue reversed: blue, cyan, yellow, orange, red
+    'RdYlBu_r': np.array([
+        [0.0, 0.0, 0.0, 1.0],
+        [0.3, 0.0, 1.0, 1.0],
+        [0.5, 1.0, 1.0, 0.0],
+        [0.7, 1.0, 0.5, 0.0],
+        [1.0, 1.0, 0.0, 0.0],
+    ]),
+    # Dark purple, purple-blue, teal, green, yellow
+    'viridis': np.array([
+        [0.0, 0.267, 0.004, 0.329],
+        [0.25, 0.229, 0.322, 0.545],
+        [0.5, 0.127, 0.566, 0.550],
+        [0.75, 0.369, 0.788, 0.382],
+        [1.0, 0.993, 0.906, 0.144],
+    ]),
+    # Dark blue, purple, magenta, orange, yellow
+    'plasma': np.array([
+        [0.0, 0.050, 0.030, 0.529],
+        [0.25, 0.494, 0.016, 0.655],
+        [0.5, 0.808, 0.067, 0.472],
+        [0.75, 0.965, 0.451, 0.176],
+        [1.0, 0.984, 0.906, 0.145],
+    ]),
+    # Almost black, dark purple, red, orange, light yellow
+    'inferno': np.array([
+        [0.0, 0.000, 0.000, 0.014],
+        [0.25, 0.341, 0.062, 0.429],
+        [0.5, 0.733, 0.216, 0.329],
+        [0.75, 0.976, 0.576, 0.176],
+        [1.0, 0.988, 0.998, 0.645],
+    ]),
+    # Traditional jet: dark blue, blue, cyan, yellow, red, dark red
+    'jet': np.array([
+        [0.0, 0.0, 0.0, 0.5],
+        [0.2, 0.0, 0.0, 1.0],
+        [0.4, 0.0, 1.0, 1.0],
+        [0.6, 1.0, 1.0, 0.0],
+        [0.8, 1.0, 0.0, 0.0],
+        [1.0, 0.5, 0.0, 0.0],
+    ]),
+    # Spectral colors: purple, blue, cyan, green, yellow, orange, red
+    'rainbow': np.array([
+        [0.0, 0.5, 0.0, 1.0],
+        [0.17, 0.0, 0.0, 1.0],
+        [0.33, 0.0, 1.0, 1.0],
+        [0.5, 0.0, 1.0, 0.0],
+        [0.67, 1.0, 1.0, 0.0],
+        [0.83, 1.0, 0.5, 0.0],
+        [1.0, 1.0, 0.0, 0.0],
+    ]),
+}
+
+
+def _make_colormap_applier(stops):
+    """Return a function that fills a color transfer function with stops spread over vmin..vmin+span"""
+    fractions = stops[:, 0].copy()
+    # Interleaved (x, r, g, b) rows, only the x column changes between calls
+    table = np.empty((len(stops), 4))
+    table[:, 1:] = stops[:, 1:]
+    
+    def apply(color_func, vmin, span):
+        table[:, 0] = vmin + fractions * span
+        color_func.FillFromDataPointer(len(table), table.ravel())
+    
+    return apply
+
+
+def _matplotlib_colormap_stops(name, n_samples=256):
+    """Return colormap stops sampled from a matplotlib colormap, or None if it is unavailable"""
+    try:
+        import matplotlib
+        cmap = matplotlib.colormaps[name]
+    except (ImportError, KeyError):
+        return None
+    
+    # One vectorized lookup gives every (r, g, b) row, the fractions go in front
+    fractions = np.linspace(0.0, 1.0, n_samples)
+    return np.column_stack((fractions, cmap(fractions)[:, :3]))
+
+
+# One specialized applier per colormap, built once at import. The matplotlib colormaps get
+# theirs on first use, see DamVisualizationApp._build_color_function
+COLORMAP_APPLIERS = {name: _make_colormap_applier(stops) for name, stops in COLORMAP_STOPS.items()}
+
+# Further colormaps offered when matplotlib is installed, sampled from it on first use
+MATPLOTLIB_COLORMAPS = ('cividis', 'magma', 'turbo', 'coolwarm', 'Spectral_r', 'RdBu_r')
+
+
+def available_colormaps():
+    """Return the names of the colormaps to offer, the built-in ones followed by those matplotlib provides"""
+    try:
+        import matplotlib
+    except ImportError:
+        return list(COLORMAP_STOPS)
+    return list(COLORMAP_STOPS) + [name for name in MATPLOTLIB_COLORMAPS if name in matplotlib.colormaps]
+
 
 class VTKVisualizationWidget(QWidget):
     """Widget containing VTK render window and interactor"""
@@ -38,7 +187,7 @@ class VTKVisualizationWidget(QWidget):
         self.setLayout(layout)
         
         # Initialize VTK components
-        self.renderer = vtk.vtkRenderer()
+        self.renderer = vtkRenderer()
         self.render_window = self.vtk_widget.GetRenderWindow()
         self.render_window.AddRenderer(self.renderer)
         self.interactor = self.vtk_widget.GetRenderWindow().GetInteractor()
@@ -59,9 +208,17 @@ class VTKVisualizationWidget(QWidget):
         self.scalar_bar_actor = None
         self.cube_axes_actor = None
         
-        # Initialize the interactor
+        # Render requests from quick parameter updates are throttled to one per frame interval
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(16)
+        self._render_timer.timeout.connect(self.render)
+        
+        # Initialize the interactor. QVTKRenderWindowInteractor is driven by Qt's event loop,
+        # so the VTK event loop is never started
+        self.interactor.SetDesiredUpdateRate(INTERACTIVE_UPDATE_RATE)
+        self.interactor.SetStillUpdateRate(STILL_UPDATE_RATE)
         self.interactor.Initialize()
-        self.interactor.Start()
     
     def setup_enhanced_lighting(self, quality='Enhanced'):
         """Set up lighting based on quality level"""
@@ -73,7 +230,7 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.SetAutomaticLightCreation(False)
             
             # Key light (main directional light)
-            key_light = vtk.vtkLight()
+            key_light = vtkLight()
             key_light.SetPosition(10, 10, 10)
             key_light.SetFocalPoint(0, 0, 0)
             key_light.SetColor(1.0, 1.0, 0.95)  # Slightly warm white
@@ -82,7 +239,7 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.AddLight(key_light)
             
             # Fill light (softer, opposite side)
-            fill_light = vtk.vtkLight()
+            fill_light = vtkLight()
             fill_light.SetPosition(-5, 5, 8)
             fill_light.SetFocalPoint(0, 0, 0)
             fill_light.SetColor(0.8, 0.9, 1.0)  # Cool blue tint
@@ -91,7 +248,7 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.AddLight(fill_light)
             
             # Back light (rim lighting)
-            back_light = vtk.vtkLight()
+            back_light = vtkLight()
             back_light.SetPosition(-8, -8, 5)
             back_light.SetFocalPoint(0, 0, 0)
             back_light.SetColor(1.0, 0.9, 0.8)  # Warm rim light
@@ -100,7 +257,7 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.AddLight(back_light)
             
             # Ambient light for overall illumination
-            ambient_light = vtk.vtkLight()
+            ambient_light = vtkLight()
             ambient_light.SetLightTypeToSceneLight()
             ambient_light.SetColor(0.4, 0.4, 0.5)  # Subtle blue ambient
             ambient_light.SetIntensity(0.1)
@@ -111,7 +268,7 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.SetAutomaticLightCreation(False)
             
             # Key light
-            key_light = vtk.vtkLight()
+            key_light = vtkLight()
             key_light.SetPosition(10, 10, 10)
             key_light.SetFocalPoint(0, 0, 0)
             key_light.SetColor(1.0, 1.0, 1.0)
@@ -119,7 +276,7 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.AddLight(key_light)
             
             # Fill light
-            fill_light = vtk.vtkLight()
+            fill_light = vtkLight()
             fill_light.SetPosition(-5, 5, 8)
             fill_light.SetFocalPoint(0, 0, 0)
             fill_light.SetColor(0.9, 0.9, 1.0)
@@ -131,14 +288,22 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.SetAutomaticLightCreation(True)
     
     def add_scalar_bar(self, color_function=None, data_range=None, title="Resistivity (log10)", show_bar=True):
-        """Add/remove scalar bar (color scale)"""
+        """Add/show or hide scalar bar (color scale)"""
         if self.scalar_bar_actor:
-            self.renderer.RemoveActor(self.scalar_bar_actor)
-            self.scalar_bar_actor = None
+            # A single bar is kept once created, updated in place and hidden rather than
+            # removed, so its text and texture resources are not reallocated
+            if show_bar and color_function and data_range:
+                if self.scalar_bar_actor.GetLookupTable() is not color_function:
+                    self.scalar_bar_actor.SetLookupTable(color_function)
+                self.scalar_bar_actor.SetTitle(title)
+                self.scalar_bar_actor.VisibilityOn()
+            else:
+                self.scalar_bar_actor.VisibilityOff()
+            return
         
         if show_bar and color_function and data_range:
             # Create scalar bar
-            scalar_bar = vtk.vtkScalarBarActor()
+            scalar_bar = vtkScalarBarActor()
             scalar_bar.SetLookupTable(color_function)
             scalar_bar.SetTitle(title)
             scalar_bar.SetNumberOfLabels(4)
@@ -173,32 +338,40 @@ class VTKVisualizationWidget(QWidget):
             self.renderer.AddActor2D(self.scalar_bar_actor)
     
     def add_volume_actor(self, volume_actor):
-        """Add volume actor to renderer"""
+        """Add volume actor to renderer (the caller renders once the scene is complete)"""
         if volume_actor:
             # Check if it's a volume or regular actor
-            if hasattr(volume_actor, 'GetMapper') and isinstance(volume_actor.GetMapper(), vtk.vtkSmartVolumeMapper):
+            if isinstance(volume_actor, vtkVolume):
                 self.renderer.AddVolume(volume_actor)  # Use AddVolume for volume actors
             else:
                 self.renderer.AddActor(volume_actor)   # Use AddActor for regular actors
-        self.render_window.Render()
+    
+    def remove_actor(self, actor):
+        """Remove a single actor or volume from renderer"""
+        if actor:
+            self.renderer.RemoveViewProp(actor)
     
     def add_cube_axes_actor(self, cube_axes_actor):
-        """Add cube axes actor to renderer"""
+        """Add cube axes actor to renderer (the caller renders once the scene is complete)"""
         if cube_axes_actor:
             if self.cube_axes_actor:
                 self.renderer.RemoveActor(self.cube_axes_actor)
             
             self.cube_axes_actor = cube_axes_actor
             self.renderer.AddActor(cube_axes_actor)
-        self.render_window.Render()
+    
+    def remove_cube_axes_actor(self):
+        """Remove cube axes actor from renderer"""
+        if self.cube_axes_actor:
+            self.renderer.RemoveActor(self.cube_axes_actor)
+            self.cube_axes_actor = None
     
     def remove_all_actors(self):
-        """Remove all actors from renderer"""
+        """Remove all actors from renderer (the caller renders once the new actors are added)"""
         self.renderer.RemoveAllViewProps()
         # Reset actor references
         self.scalar_bar_actor = None
         self.cube_axes_actor = None
-        self.render_window.Render()
     
     def reset_camera(self):
         """Reset camera to fit all objects"""
@@ -207,15 +380,28 @@ class VTKVisualizationWidget(QWidget):
     
     def render(self):
         """Render the scene"""
+        # A pending requested render would only repeat this one
+        self._render_timer.stop()
         self.render_window.Render()
+    
+    def set_interactive(self, interactive):
+        """Render at reduced detail for interactive frame rates, or at full detail"""
+        self.render_window.SetDesiredUpdateRate(INTERACTIVE_UPDATE_RATE if interactive else STILL_UPDATE_RATE)
+    
+    def request_render(self):
+        """Render the scene within the next frame interval, at most once however often this is called"""
+        if not self._render_timer.isActive():
+            self._render_timer.start()
 
     def capture_screenshot(self, filename):
-        """Capture screenshot of the current render window"""
-        window_to_image_filter = vtk.vtkWindowToImageFilter()
+        """Capture screenshot of the current render window (the caller renders the scene first)"""
+        window_to_image_filter = vtkWindowToImageFilter()
         window_to_image_filter.SetInput(self.render_window)
+        # Read back the frame that is already on screen instead of rendering it a second time
+        window_to_image_filter.ShouldRerenderOff()
         window_to_image_filter.Update()
 
-        writer = vtk.vtkPNGWriter()
+        writer = vtkPNGWriter()
         writer.SetFileName(filename)
         writer.SetInputConnection(window_to_image_filter.GetOutputPort())
         writer.Write()
@@ -226,13 +412,64 @@ class ControlPanel(QWidget):
     
     # Signals
     apply_changes = pyqtSignal()
+    scrubbing_changed = pyqtSignal(bool)  # True while the frame slider is dragged
+    
+    LIVE_PREVIEW_DELAY_MS = 80  # Debounce interval, ~12 updates per second while dragging
+    
+    # Dirty flags, telling the app which kinds of parameters changed since the last apply
+    DIRTY_OPACITY = 1
+    DIRTY_BOUNDS = 2
+    DIRTY_FRAME = 4
+    DIRTY_COLORMAP = 8
+    DIRTY_TARGET_CELLS = 16
+    DIRTY_ISO_OPACITY = 32
+    DIRTY_OTHER = 64
+    
+    # Apply button style, blue when clean and orange when there are unapplied changes
+    APPLY_BUTTON_STYLE = """
+        QPushButton { 
+            background-color: #2196F3; 
+            color: white;
+            font-weight: bold; 
+            padding: 8px;
+            border: none;
+            border-radius: 4px;
+        }
+        QPushButton:hover { 
+            background-color: #1976D2; 
+        }
+        QPushButton:pressed { 
+            background-color: #1565C0; 
+        }
+        QPushButton[dirty="true"] { 
+            background-color: #FF9800; 
+        }
+        QPushButton[dirty="true"]:hover { 
+            background-color: #F57C00; 
+        }
+        QPushButton[dirty="true"]:pressed { 
+            background-color: #E65100; 
+        }
+    """
     
     def __init__(self, parent=None, main_app=None):
         super().__init__(parent)
         self.main_app = main_app
         
+        # Coalesce rapid parameter changes in live preview mode
+        self._pending_changes = {}  # sender -> last seen value
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.timeout.connect(self._apply_pending)
+        
         self.setup_ui()
         self.connect_signals()
+        
+        for slider in self.opacity_sliders:
+            slider.blockSignals(False)
+        
+        # Preallocated buffer refilled by get_opacity_values
+        self._opacity_buf = np.empty(len(self.opacity_sliders), dtype=np.float32)
     
     def setup_ui(self):
         """Set up the control panel UI"""
@@ -282,6 +519,9 @@ class ControlPanel(QWidget):
         # Create horizontal layout for sliders
         sliders_layout = QHBoxLayout()
         
+        # Hold off repaints while the sliders are created and laid out
+        self.setUpdatesEnabled(False)
+        
         self.opacity_sliders = []
         self.opacity_labels = []
         
@@ -292,6 +532,7 @@ class ControlPanel(QWidget):
             # Value label at top            
             # Vertical slider
             slider = QSlider(Qt.Vertical)
+            slider.blockSignals(True)  # Released in __init__ once signals are connected
             slider.setMinimum(0)
             slider.setMaximum(100)
             slider.setValue(10)  # Default value
@@ -338,6 +579,8 @@ class ControlPanel(QWidget):
         opacity_group.setLayout(opacity_layout)
         layout.addWidget(opacity_group)
         
+        self.setUpdatesEnabled(True)
+        
         # Bounds controls group
         bounds_group = QGroupBox("Clipping Bounds")
         bounds_layout = QGridLayout()
@@ -373,7 +616,7 @@ class ControlPanel(QWidget):
         colormap_layout = QHBoxLayout()
         colormap_layout.addWidget(QLabel("Colormap:"))
         self.colormap_combo = QComboBox()
-        self.colormap_combo.addItems(['RdYlBu_r', 'viridis', 'plasma', 'inferno', 'jet', 'rainbow'])
+        self.colormap_combo.addItems(available_colormaps())
         self.colormap_combo.setCurrentText('RdYlBu_r')
         colormap_layout.addWidget(self.colormap_combo)
         render_layout.addLayout(colormap_layout)
@@ -527,6 +770,11 @@ class ControlPanel(QWidget):
         self.show_colorbar_checkbox.setChecked(True)
         render_layout.addWidget(self.show_colorbar_checkbox)
         
+        # Live preview checkbox, applies changes without pressing Apply
+        self.live_preview_checkbox = QCheckBox("Live Preview")
+        self.live_preview_checkbox.setChecked(False)
+        render_layout.addWidget(self.live_preview_checkbox)
+        
         render_group.setLayout(render_layout)
         layout.addWidget(render_group)
         
@@ -541,7 +789,7 @@ class ControlPanel(QWidget):
         self.reset_button.setFixedSize(*button_size)
         
         # Initialize dirty flag and button styles
-        self._is_dirty = False
+        self._dirty_mask = 0
         self._setup_button_styles()
         
         button_layout.addWidget(self.apply_button)
@@ -558,69 +806,48 @@ class ControlPanel(QWidget):
     
     def _setup_button_styles(self):
         """Set up button styles for clean and dirty states"""
-        self._clean_style = """
-            QPushButton { 
-                background-color: #2196F3; 
-                color: white;
-                font-weight: bold; 
-                padding: 8px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { 
-                background-color: #1976D2; 
-            }
-            QPushButton:pressed { 
-                background-color: #1565C0; 
-            }
-        """
-        
-        self._dirty_style = """
-            QPushButton { 
-                background-color: #FF9800; 
-                color: white;
-                font-weight: bold; 
-                padding: 8px;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover { 
-                background-color: #F57C00; 
-            }
-            QPushButton:pressed { 
-                background-color: #E65100; 
-            }
-        """
-        
-        # Set initial clean state
-        self.apply_button.setStyleSheet(self._clean_style)
+        # One sheet for both states, switched by the 'dirty' property in set_dirty
+        self.apply_button.setStyleSheet(self.APPLY_BUTTON_STYLE)
+        self.apply_button.setProperty('dirty', False)
         self.apply_button.setText("Apply Changes")
     
-    def set_dirty(self, dirty=True):
-        """Set dirty flag and update button appearance"""
-        self._is_dirty = dirty
+    def set_dirty(self, dirty=True, flags=None):
+        """Set dirty flags (DIRTY_OTHER unless given) or clear them, and update button appearance"""
+        was_dirty = self._dirty_mask != 0
         if dirty:
-            self.apply_button.setStyleSheet(self._dirty_style)
-            self.apply_button.setText("Apply Changes")
+            self._dirty_mask |= self.DIRTY_OTHER if flags is None else flags
         else:
-            self.apply_button.setStyleSheet(self._clean_style)
-            self.apply_button.setText("Apply Changes")
+            self._dirty_mask = 0
+        if dirty == was_dirty:
+            return
+        
+        # Re-polish so the [dirty] selectors are re-evaluated without reparsing the sheet
+        self.apply_button.setProperty('dirty', dirty)
+        style = self.apply_button.style()
+        style.unpolish(self.apply_button)
+        style.polish(self.apply_button)
     
     def is_dirty(self):
         """Check if parameters have been modified"""
-        return self._is_dirty
+        return self._dirty_mask != 0
+    
+    def dirty_flags(self):
+        """Get the DIRTY_* flags of the parameters modified since the last apply"""
+        return self._dirty_mask
     
     def connect_signals(self):
         """Connect widget signals"""
         # Connect parameter change handlers to set dirty flag
         self.frame_slider.valueChanged.connect(self.on_parameter_changed)
+        self.frame_slider.sliderPressed.connect(self.on_frame_slider_pressed)
+        self.frame_slider.sliderReleased.connect(self.on_frame_slider_released)
         
-        for i, slider in enumerate(self.opacity_sliders):
-            slider.valueChanged.connect(self.on_opacity_changed)
+        # on_opacity_changed and on_bounds_changed do nothing per tick, so only the
+        # debounced on_parameter_changed is connected to avoid a second slot call per event
+        for slider in self.opacity_sliders:
             slider.valueChanged.connect(self.on_parameter_changed)
         
         for spinbox in self.bounds_spinboxes:
-            spinbox.valueChanged.connect(self.on_bounds_changed)
             spinbox.valueChanged.connect(self.on_parameter_changed)
         
         self.colormap_combo.currentTextChanged.connect(self.on_parameter_changed)
@@ -656,6 +883,14 @@ class ControlPanel(QWidget):
         
         # Connect apply button
         self.apply_button.clicked.connect(self.on_apply_clicked)
+        
+        # Dirty flags per widget, anything not listed is DIRTY_OTHER
+        self._sender_flags = {slider: self.DIRTY_OPACITY for slider in self.opacity_sliders}
+        self._sender_flags.update({spinbox: self.DIRTY_BOUNDS for spinbox in self.bounds_spinboxes})
+        self._sender_flags[self.frame_slider] = self.DIRTY_FRAME
+        self._sender_flags[self.colormap_combo] = self.DIRTY_COLORMAP
+        self._sender_flags[self.target_cells_spinbox] = self.DIRTY_TARGET_CELLS
+        self._sender_flags[self.iso_opacity_spinbox] = self.DIRTY_ISO_OPACITY
     
     def on_parameter_changed(self):
         """Handle any parameter change - set dirty flag"""
@@ -664,8 +899,31 @@ class ControlPanel(QWidget):
         if sender == self.frame_slider:
             self.frame_label.setText(f"Frame: {sender.value()}")
         
-        # Set dirty flag
-        self.set_dirty(True)
+        # Set dirty flag for the kind of parameter that changed
+        self.set_dirty(True, self._sender_flags.get(sender, self.DIRTY_OTHER))
+        
+        # In live preview mode apply once the user pauses, restarting the timer on every change
+        if self.live_preview_checkbox.isChecked():
+            if sender is not None and hasattr(sender, 'value'):
+                self._pending_changes[sender] = sender.value()
+            else:
+                self._pending_changes[sender] = None
+            self._debounce.start(self.LIVE_PREVIEW_DELAY_MS)
+    
+    def on_frame_slider_pressed(self):
+        """Report the start of a frame slider drag"""
+        self.scrubbing_changed.emit(True)
+    
+    def on_frame_slider_released(self):
+        """Report the end of a frame slider drag"""
+        self.scrubbing_changed.emit(False)
+    
+    def _apply_pending(self):
+        """Apply the terminal state of coalesced parameter changes"""
+        if not self._pending_changes:
+            return
+        self._pending_changes.clear()
+        self.on_apply_clicked()
     
     def on_opacity_changed(self):
         """Handle opacity slider changes - update labels only"""
@@ -697,6 +955,8 @@ class ControlPanel(QWidget):
     
     def on_apply_clicked(self):
         """Handle apply button click"""
+        self._debounce.stop()
+        self._pending_changes.clear()
         self.apply_changes.emit()
         self.set_dirty(False)  # Clear dirty flag after applying
     
@@ -705,7 +965,7 @@ class ControlPanel(QWidget):
         for slider in self.opacity_sliders:
             slider.setValue(100)
         self.on_opacity_changed()  # Update labels
-        self.set_dirty(True)
+        self.set_dirty(True, self.DIRTY_OPACITY)
     
     def apply_opacity_preset_linear_up(self):
         """Set opacity sliders in linear increasing pattern"""
@@ -715,7 +975,7 @@ class ControlPanel(QWidget):
             value = int((i / (num_sliders - 1)) * 100)
             slider.setValue(value)
         self.on_opacity_changed()  # Update labels
-        self.set_dirty(True)
+        self.set_dirty(True, self.DIRTY_OPACITY)
     
     def apply_opacity_preset_linear_down(self):
         """Set opacity sliders in linear decreasing pattern"""
@@ -725,7 +985,7 @@ class ControlPanel(QWidget):
             value = int(((num_sliders - 1 - i) / (num_sliders - 1)) * 100)
             slider.setValue(value)
         self.on_opacity_changed()  # Update labels
-        self.set_dirty(True)
+        self.set_dirty(True, self.DIRTY_OPACITY)
     
     def apply_opacity_preset_max_middle(self):
         """Set opacity sliders with maximum in the middle"""
@@ -737,7 +997,7 @@ class ControlPanel(QWidget):
             value = int((1.0 - distance) * 100)
             slider.setValue(max(0, value))
         self.on_opacity_changed()  # Update labels
-        self.set_dirty(True)
+        self.set_dirty(True, self.DIRTY_OPACITY)
     
     def apply_opacity_preset_max_sides(self):
         """Set opacity sliders with maximum at left and right sides"""
@@ -749,7 +1009,7 @@ class ControlPanel(QWidget):
             value = int(distance * 100)
             slider.setValue(min(100, value))
         self.on_opacity_changed()  # Update labels
-        self.set_dirty(True)
+        self.set_dirty(True, self.DIRTY_OPACITY)
     
     def set_frame_range(self, min_frame, max_frame):
         """Set the range for frame slider"""
@@ -777,16 +1037,14 @@ class ControlPanel(QWidget):
         self.progress_bar.setValue(value)
     
     def get_opacity_values(self):
-        """Get current opacity values from sliders"""
-        opacity_values = []
-        for slider in self.opacity_sliders:
-            value = slider.value() / 100.0
-            opacity_values.append(value)
-        return opacity_values
+        """Get current opacity values from sliders as a shared float32 array, overwritten by the next call"""
+        np.multiply(np.fromiter(map(_value, self.opacity_sliders), dtype=np.int32, count=len(self.opacity_sliders)),
+                    0.01, out=self._opacity_buf)
+        return self._opacity_buf
     
     def get_bounds_values(self):
         """Get current bounds values from spinboxes"""
-        return [spinbox.value() for spinbox in self.bounds_spinboxes]
+        return list(map(_value, self.bounds_spinboxes))
     
     def get_colormap(self):
         """Get current colormap selection"""
@@ -896,6 +1154,31 @@ class ControlPanel(QWidget):
             self.main_app.auto_detect_scalar_range()
 
 
+class ResampleSignals(QObject):
+    """Signals emitted by ResampleWorker"""
+    finished = pyqtSignal(int, object)  # job id, result of the function (None on failure)
+
+
+class ResampleWorker(QRunnable):
+    """Run a resampling function on a thread pool thread"""
+    
+    def __init__(self, job_id, func, *args):
+        super().__init__()
+        self.job_id = job_id
+        self.func = func
+        self.args = args
+        self.signals = ResampleSignals()
+    
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception:
+            # Anything raised here would be lost with the thread, the caller gets None instead
+            logger.exception("Error preparing frame data")
+            result = None
+        self.signals.finished.emit(self.job_id, result)
+
+
 class DamVisualizationApp(QMainWindow):
     """Main application window"""
     
@@ -904,10 +1187,51 @@ class DamVisualizationApp(QMainWindow):
         
         # Initialize data
         self.data_location = None
-        self.vtk_files = {}
+        self.vtk_files = {}  # frame number -> file name, sorted by frame
+        self._frame_indices = np.empty(0, dtype=np.int64)  # Sorted frame numbers of vtk_files
         self.current_volume_actor = None
         self.bounds_actor = None
+        self._bounds_actor_bounds = None  # Bounds the axes grid was last set to
+        self._camera_bounds = None  # Bounds the camera was last fitted to
         self.current_color_function = None
+        self._applied_lighting_quality = 'Enhanced'  # VTKVisualizationWidget starts with Enhanced lighting
+        self._color_func_cache = {}  # (colormap, min, max) -> vtkColorTransferFunction
+        self._sampled_colormap_appliers = {}  # matplotlib colormap name -> applier, see _build_color_function
+        self._job_seq = 0  # Latest resample job, older results are dropped
+        self._pending_frame = None  # (frame_index, should_show_volume, cache_key, cached volume) of the latest job
+        self._frame_cache = OrderedDict()  # (frame, scalars, bounds, target_cells) -> resampled ImageData
+        self._mesh_cache = OrderedDict()  # (file path, scalar name) -> mesh as read from disk
+        self._prefetch = {}  # (file path, scalar name) -> Future of a background read
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_FRAMES)
+        self._thread_pool = QThreadPool.globalInstance()
+        self._scalar_ref = None  # NumPy buffer backing the volume scalars
+        self._slab_ranges = None  # Per-axis (min, max) of each slab of _scalar_ref
+        self._volume_image = None  # vtkImageData wrapping _scalar_ref, refilled for frames on the same grid
+        self._volume_structure = None  # (dimensions, origin, spacing) of _volume_image
+        self._dir_scan_cache = {}  # folder -> (mtime, {frame: filename})
+        self._c2p_cache = {}  # id(mesh) -> (weakref to mesh, mesh with point data)
+        self._range_cache = {}  # (file path, scalar name, active scalars) -> (min, max), see frame_scalar_range
+        self._opacity_points = None  # Interleaved opacity points buffer, see create_opacity_function
+        self._opacity_xs_key = None
+        self._volume_property_cache = {}  # (colormap, scale) -> (vtkVolumeProperty, opacity it holds)
+        self._gradient_opacity = None  # Shared by all volume properties, see get_volume_property
+        self._gradient_opacity_range = None  # (min, max) data range _gradient_opacity is scaled for
+        self._scrubbing = False  # Frame slider is being dragged, volumes are drawn unshaded
+        self._volume_mapper = None  # Reused between frames, see create_volume_actor
+        self._shared_topology = None  # Topology hash of the mesh the shared locator was built for
+        self._shared_locator = None
+        self._shared_points = None  # float32 vtkPoints of the shared topology, see shared_cell_locator
+        self._uniform_grids = {}  # clipped bounds -> empty uniform grid for _grid_target_cells
+        self._grid_target_cells = None
+        self._locator_lock = threading.Lock()  # Resampling runs on worker threads
+        
+        # Coalesce update requests, only the last one within the interval runs
+        self._pending_update_frame = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
+        self._volume_actor = None
         
         # Visualization parameters
         self.opacity = [0.0, 0.05, 0.1, 0.15, 0.2, 0.4, 0.6, 0.8, 1.0, 0.9, 0.7, 0.5, 0.3, 0.2, 0.1, 0.05, 0.0, 0.0]
@@ -926,6 +1250,7 @@ class DamVisualizationApp(QMainWindow):
         self.iso_opacity = 0.8
         self.lighting_quality = 'Enhanced'
         self.current_iso_actors = []  # Changed to list for multiple isosurfaces
+        self._iso_actor_pool = []  # (actor, mapper, LOD mapper), reused from frame to frame
         self.global_min = 0.0  # Will be auto-detected from actual data
         self.global_max = 1.0  # Will be auto-detected from actual data
         
@@ -973,7 +1298,13 @@ class DamVisualizationApp(QMainWindow):
         # Menu bar
         self.create_menu_bar()
         
-        # Status bar
+        # Status bar, with an error indicator that stays until a frame is displayed again.
+        # Frame update errors are reported here rather than in dialogs, which would block
+        # playback and pile up while scrubbing
+        self.error_label = QLabel("\u26a0 Error")
+        self.error_label.setStyleSheet("color: #D32F2F; font-weight: bold;")
+        self.error_label.setVisible(False)
+        self.statusBar().addPermanentWidget(self.error_label)
         self.statusBar().showMessage("Ready")
     
     def create_menu_bar(self):
@@ -1000,6 +1331,7 @@ class DamVisualizationApp(QMainWindow):
     def connect_signals(self):
         """Connect signals"""
         self.control_panel.apply_changes.connect(self.apply_parameter_changes)
+        self.control_panel.scrubbing_changed.connect(self.on_scrubbing_changed)
         self.control_panel.reset_button.clicked.connect(self.vtk_widget.reset_camera)
 
         self.control_panel.frame_video_button.clicked.connect(self.on_create_video)
@@ -1014,25 +1346,33 @@ class DamVisualizationApp(QMainWindow):
         """Load VTK files from data location"""
         self.data_location = folder_path
         self.vtk_files = {}
+        self._frame_indices = np.empty(0, dtype=np.int64)
+        self._frame_cache.clear()
+        self._mesh_cache.clear()
+        self._range_cache.clear()
+        for future in self._prefetch.values():
+            future.cancel()
+        self._prefetch.clear()
         
         try:
-            # Find VTK files
-            for file in os.listdir(folder_path):
-                if file.startswith("dcinv") and file.endswith(".vtk"):
-                    number = int(file.split('_')[-1].split('.')[0])
-                    self.vtk_files[number] = file
+            # Find VTK files sorted by frame, rescanning only if the directory changed
+            mtime = os.stat(folder_path).st_mtime
+            cached = self._dir_scan_cache.get(folder_path)
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, dvu.find_vtk_files(folder_path))
+                self._dir_scan_cache[folder_path] = cached
+            self.vtk_files = dict(cached[1])
             
             if not self.vtk_files:
                 QMessageBox.warning(self, "Warning", "No VTK files found in selected directory")
                 return
             
-            # Sort files
-            sorted_keys = sorted(self.vtk_files.keys())
-            self.vtk_files = {key: self.vtk_files[key] for key in sorted_keys}
+            # Sorted frame numbers next to vtk_files, for positional lookups of neighboring frames
+            self._frame_indices = np.fromiter(self.vtk_files, dtype=np.int64, count=len(self.vtk_files))
             
             # Update control panel
-            min_frame = min(self.vtk_files.keys())
-            max_frame = max(self.vtk_files.keys())
+            min_frame = int(self._frame_indices[0])
+            max_frame = int(self._frame_indices[-1])
             self.control_panel.set_frame_range(min_frame, max_frame)
             self.control_panel.set_opacity_values(self.opacity)
             self.control_panel.set_bounds_values(self.bounds)
@@ -1044,11 +1384,11 @@ class DamVisualizationApp(QMainWindow):
             # Set initial frame but don't load until Apply is clicked
             self.control_panel.frame_slider.setValue(min_frame)
             
-            # Load first frame initially
-            self.update_visualization(min_frame)
+            # Fit the camera again once the first frame of the new data is displayed
+            self._camera_bounds = None
             
-            # Ensure camera is properly positioned for the initial view
-            self.vtk_widget.reset_camera()
+            # Load first frame initially
+            self.update_visualization(min_frame, background=True)
             
             # Clear dirty flag after initial load
             self.control_panel.set_dirty(False)
@@ -1065,7 +1405,7 @@ class DamVisualizationApp(QMainWindow):
                 return
             
             # Load the first file to inspect available scalars
-            first_file_idx = min(self.vtk_files.keys())
+            first_file_idx = int(self._frame_indices[0])
             file_path = os.path.join(self.data_location, self.vtk_files[first_file_idx])
             mesh = pv.read(file_path)
             
@@ -1111,13 +1451,11 @@ class DamVisualizationApp(QMainWindow):
             if "(cell)" in scalar_name:
                 scalar_name = scalar_name.replace(" (cell)", "")
                 if scalar_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
+                    mesh = self.cell_data_to_point_data(mesh)
             
             # Get the scalar data
             if scalar_name in mesh.point_data:
-                data = mesh.point_data[scalar_name]
-                auto_min = float(np.nanmin(data))
-                auto_max = float(np.nanmax(data))
+                auto_min, auto_max = dvu.scalar_range(mesh, scalar_name)
                 
                 # Update global values
                 self.global_min = auto_min
@@ -1143,18 +1481,54 @@ class DamVisualizationApp(QMainWindow):
         except Exception as e:
             print(f"Error auto-detecting initial data range: {e}")
     
-    def create_gradient_opacity_function(self):
-        """Create gradient opacity function for better depth perception"""
-        gradient_opacity = vtk.vtkPiecewiseFunction()
+    def create_gradient_opacity_function(self, vmin, vmax):
+        """Create gradient opacity function for better depth perception, for volumes quantized over [vmin, vmax]"""
+        gradient_opacity = vtkPiecewiseFunction()
+        self.fill_gradient_opacity_function(gradient_opacity, vmin, vmax)
+        return gradient_opacity
+    
+    def fill_gradient_opacity_function(self, gradient_opacity, vmin, vmax):
+        """(Re)fill a gradient opacity function in place for volumes quantized over [vmin, vmax]"""
+        # The gradients are given in data units. Quantizing [vmin, vmax] to 0-255 scales the
+        # gradients of the volume scalars by 255 / (vmax - vmin), and the points with them.
+        # An empty range is widened like in create_volume_actor
+        if vmax <= vmin:
+            vmax = vmin + 1.0
+        scale = 255.0 / (vmax - vmin)
         
         # Define gradient opacity - higher gradients (edges) are more opaque
-        gradient_opacity.AddPoint(0.0, 0.0)    # No gradient = transparent
-        gradient_opacity.AddPoint(50.0, 0.2)   # Low gradient = slightly opaque
-        gradient_opacity.AddPoint(100.0, 0.5)  # Medium gradient = more opaque
-        gradient_opacity.AddPoint(200.0, 0.8)  # High gradient = very opaque (edges)
-        gradient_opacity.AddPoint(500.0, 1.0)  # Very high gradient = fully opaque
+        gradient_opacity.RemoveAllPoints()
+        gradient_opacity.AddPoint(0.0, 0.0)            # No gradient = transparent
+        gradient_opacity.AddPoint(50.0 * scale, 0.2)   # Low gradient = slightly opaque
+        gradient_opacity.AddPoint(100.0 * scale, 0.5)  # Medium gradient = more opaque
+        gradient_opacity.AddPoint(200.0 * scale, 0.8)  # High gradient = very opaque (edges)
+        gradient_opacity.AddPoint(500.0 * scale, 1.0)  # Very high gradient = fully opaque
+    
+    def create_opacity_function(self, vmin, vmax, scale=1.0):
+        """Create scalar opacity function with the opacity values spread evenly over [vmin, vmax]"""
+        opacity_func = vtkPiecewiseFunction()
+        self.fill_opacity_function(opacity_func, vmin, vmax, scale=scale)
+        return opacity_func
+    
+    def fill_opacity_function(self, opacity_func, vmin, vmax, scale=1.0):
+        """Replace the points of an opacity function with the opacity values spread evenly over [vmin, vmax]"""
+        if vmax <= vmin:
+            # Degenerate range, a single constant point instead of an empty (invisible) function
+            opacity_func.RemoveAllPoints()
+            opacity_func.AddPoint(vmin, float(self.opacity[0]) * scale if len(self.opacity) else 1.0)
+            return
         
-        return gradient_opacity
+        # Interleaved (x0, y0, x1, y1, ...) points, set in a single call. The buffer and its
+        # x positions are kept until the range or number of points changes
+        n_points = len(self.opacity)
+        xs_key = (vmin, vmax, n_points)
+        if self._opacity_xs_key != xs_key:
+            self._opacity_points = np.empty(2 * n_points, dtype=np.float64)
+            self._opacity_points[0::2] = np.linspace(vmin, vmax, n_points)
+            self._opacity_xs_key = xs_key
+        points = self._opacity_points
+        np.multiply(self.opacity, scale, out=points[1::2])
+        opacity_func.FillFromDataPointer(n_points, points)
     
     def create_isosurface_actors(self, mesh):
         """Create VTK isosurface actors from mesh (single or multiple surfaces)"""
@@ -1165,19 +1539,19 @@ class DamVisualizationApp(QMainWindow):
                 # Remove the "(cell)" suffix and convert cell data to point data
                 scalar_name = scalar_name.replace(" (cell)", "")
                 if scalar_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
+                    mesh = self.cell_data_to_point_data(mesh)
             else:
                 # For point data, ensure it exists
                 if scalar_name not in mesh.point_data and mesh.active_scalars_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
+                    mesh = self.cell_data_to_point_data(mesh)
             
             # Set the active scalars
             try:
                 mesh.set_active_scalars(scalar_name)
-                print(f"Creating isosurface(s) with active scalars: {scalar_name}")
+                logger.debug("Creating isosurface(s) with active scalars: %s", scalar_name)
             except:
                 # Fallback to default if the selected scalar doesn't exist
-                print(f"Warning: Scalar '{scalar_name}' not found for isosurface, using default")
+                logger.warning("Scalar '%s' not found for isosurface, using default", scalar_name)
                 if 'Resistivity(log10)' in mesh.point_data:
                     mesh.set_active_scalars('Resistivity(log10)')
                 else:
@@ -1185,26 +1559,15 @@ class DamVisualizationApp(QMainWindow):
                     available_scalars = list(mesh.point_data.keys())
                     if available_scalars:
                         mesh.set_active_scalars(available_scalars[0])
-                        print(f"Using fallback scalar for isosurface: {available_scalars[0]}")
+                        logger.debug("Using fallback scalar for isosurface: %s", available_scalars[0])
             
             # Clip mesh
             clipped = mesh.clip_box(bounds=self.bounds, invert=False)
             
             # Determine isosurface values
-            if self.iso_single_mode:
-                iso_values = [self.iso_value]
-            else:
-                # Create multiple isosurfaces between min and max
-                if self.global_max > self.global_min and self.iso_num_surfaces > 1:
-                    iso_values = []
-                    step = (self.global_max - self.global_min) / (self.iso_num_surfaces + 1)
-                    for i in range(1, self.iso_num_surfaces + 1):
-                        iso_values.append(self.global_min + i * step)
-                else:
-                    # Fallback to single value if range is invalid
-                    iso_values = [self.iso_value]
+            iso_values = self.isosurface_values()
             
-            print(f"Creating isosurfaces at values: {iso_values}")
+            logger.debug("Creating isosurfaces at values: %s", iso_values)
             
             actors = []
             for i, iso_val in enumerate(iso_values):
@@ -1212,32 +1575,20 @@ class DamVisualizationApp(QMainWindow):
                 iso_surface = clipped.contour(isosurfaces=[iso_val])
                 
                 if iso_surface.n_points == 0:
-                    print(f"Warning: No isosurface generated for value {iso_val}")
+                    logger.warning("No isosurface generated for value %s", iso_val)
                     continue
                 
-                # Create mapper
-                mapper = vtk.vtkPolyDataMapper()
+                # Take the next pooled actor and hand the new surface to its mapper
+                actor, mapper, lod_mapper = self.iso_actor_slot(len(actors))
                 mapper.SetInputData(iso_surface)
                 mapper.SetScalarRange(self.global_min, self.global_max)
                 
-                # Create color transfer function for isosurface
-                color_func = vtk.vtkColorTransferFunction()
-                
                 # Use same colormap as volume but for isosurface
-                if self.colormap == 'RdYlBu_r':
-                    color_func.AddRGBPoint(self.global_min, 0.0, 0.0, 1.0)  # Blue
-                    color_func.AddRGBPoint(self.global_min + 0.3 * (self.global_max - self.global_min), 0.0, 1.0, 1.0)  # Cyan
-                    color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 1.0, 1.0, 0.0)  # Yellow
-                    color_func.AddRGBPoint(self.global_min + 0.7 * (self.global_max - self.global_min), 1.0, 0.5, 0.0)  # Orange
-                    color_func.AddRGBPoint(self.global_max, 1.0, 0.0, 0.0)  # Red
-                elif self.colormap == 'viridis':
-                    color_func.AddRGBPoint(self.global_min, 0.267, 0.004, 0.329)  # Dark purple
-                    color_func.AddRGBPoint(self.global_min + 0.25 * (self.global_max - self.global_min), 0.229, 0.322, 0.545)  # Purple-blue
-                    color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 0.127, 0.566, 0.550)  # Teal
-                    color_func.AddRGBPoint(self.global_min + 0.75 * (self.global_max - self.global_min), 0.369, 0.788, 0.382)  # Green
-                    color_func.AddRGBPoint(self.global_max, 0.993, 0.906, 0.144)  # Yellow
+                if self.colormap in ('RdYlBu_r', 'viridis'):
+                    color_func = self.get_color_function(self.colormap, self.global_min, self.global_max)
                 else:
                     # Default fallback - use a single color based on iso value position in range
+                    color_func = vtkColorTransferFunction()
                     if self.global_max > self.global_min:
                         normalized_value = (iso_val - self.global_min) / (self.global_max - self.global_min)
                         # Color based on position: blue (low) -> green (mid) -> red (high)
@@ -1257,17 +1608,21 @@ class DamVisualizationApp(QMainWindow):
                 
                 mapper.SetLookupTable(color_func)
                 
-                # Create actor
-                actor = vtk.vtkActor()
-                actor.SetMapper(mapper)
+                # Large surfaces switch to a decimated copy while the view is moved or the
+                # frames are scrubbed, small ones are their own level of detail. The clustering
+                # is connected lazily, so it only runs once the LOD mapper is actually drawn
+                if iso_surface.n_cells > ISO_LOD_MIN_CELLS:
+                    decimate = vtkQuadricClustering()
+                    decimate.SetInputData(iso_surface)
+                    decimate.SetNumberOfDivisions(ISO_LOD_DIVISIONS, ISO_LOD_DIVISIONS, ISO_LOD_DIVISIONS)
+                    lod_mapper.SetInputConnection(decimate.GetOutputPort())
+                else:
+                    lod_mapper.SetInputData(iso_surface)
+                lod_mapper.SetScalarRange(self.global_min, self.global_max)
+                lod_mapper.SetLookupTable(color_func)
                 
                 # Set actor properties
-                base_opacity = self.iso_opacity
-                # For multiple surfaces, make them slightly more transparent to avoid visual clutter
-                if not self.iso_single_mode and len(iso_values) > 1:
-                    base_opacity *= 0.7  # Reduce opacity for multiple surfaces
-                
-                actor.GetProperty().SetOpacity(base_opacity)
+                actor.GetProperty().SetOpacity(self.isosurface_opacity(len(iso_values)))
                 actor.GetProperty().SetInterpolationToGouraud()  # Smooth shading
                 actor.GetProperty().SetSpecular(0.6)  # Add some shininess
                 actor.GetProperty().SetSpecularPower(30)
@@ -1276,204 +1631,427 @@ class DamVisualizationApp(QMainWindow):
                 actor.GetProperty().SetBackfaceCulling(False)  # Render back faces
                 actor.GetProperty().SetFrontfaceCulling(False)  # Render front faces
                 
-                # Make the surface more opaque to properly occlude volume rendering
-                if base_opacity >= 0.9:  # If nearly opaque, make it fully opaque
-                    actor.GetProperty().SetOpacity(1.0)
-                
                 actors.append(actor)
-                print(f"Isosurface actor created for value {iso_val} with {iso_surface.n_points} points")
+                logger.debug("Isosurface actor created for value %s with %s points", iso_val, iso_surface.n_points)
             
             return actors
             
         except Exception as e:
-            print(f"Error creating isosurface actors: {e}")
+            logger.error("Error creating isosurface actors: %s", e)
             return []
     
-    def create_volume_actor(self, mesh):
-        """Create VTK volume actor from mesh"""
+    def isosurface_values(self):
+        """Get the values to create isosurfaces at for the current settings"""
+        if self.iso_single_mode:
+            return [self.iso_value]
+        
+        # Create multiple isosurfaces between min and max
+        if self.global_max > self.global_min and self.iso_num_surfaces > 1:
+            # Evenly spaced strictly inside the range, the end points themselves are dropped
+            return np.linspace(self.global_min, self.global_max, self.iso_num_surfaces + 2)[1:-1].tolist()
+        
+        # Fallback to single value if range is invalid
+        return [self.iso_value]
+    
+    def isosurface_opacity(self, n_surfaces):
+        """Get the actor opacity for isosurfaces drawn n_surfaces at a time"""
+        base_opacity = self.iso_opacity
+        # For multiple surfaces, make them slightly more transparent to avoid visual clutter
+        if not self.iso_single_mode and n_surfaces > 1:
+            base_opacity *= 0.7  # Reduce opacity for multiple surfaces
+        
+        # Make the surface more opaque to properly occlude volume rendering
+        if base_opacity >= 0.9:  # If nearly opaque, make it fully opaque
+            return 1.0
+        return base_opacity
+    
+    def iso_actor_slot(self, index):
+        """Get the pooled actor, mapper and LOD mapper for the index-th isosurface, creating them on first use"""
+        while len(self._iso_actor_pool) <= index:
+            mapper = vtkPolyDataMapper()
+            lod_mapper = vtkPolyDataMapper()
+            actor = vtkLODActor()
+            actor.SetMapper(mapper)
+            actor.AddLODMapper(lod_mapper)
+            self._iso_actor_pool.append((actor, mapper, lod_mapper))
+        return self._iso_actor_pool[index]
+    
+    def get_color_function(self, colormap, vmin, vmax):
+        """Return the color transfer function for a colormap and data range, built once per key"""
+        key = (colormap, vmin, vmax)
+        color_func = self._color_func_cache.get(key)
+        if color_func is None:
+            color_func = self._build_color_function(colormap, vmin, vmax)
+            self._color_func_cache[key] = color_func
+        return color_func
+    
+    def _build_color_function(self, colormap, vmin, vmax):
+        """Build a color transfer function for the given colormap over [vmin, vmax]"""
+        # Colormaps without built-in stops are sampled from matplotlib once, unknown ones fall back to RdYlBu_r
+        apply_colormap = COLORMAP_APPLIERS.get(colormap) or self._sampled_colormap_appliers.get(colormap)
+        if apply_colormap is None:
+            stops = _matplotlib_colormap_stops(colormap)
+            if stops is None:
+                apply_colormap = COLORMAP_APPLIERS['RdYlBu_r']
+            else:
+                apply_colormap = self._sampled_colormap_appliers[colormap] = _make_colormap_applier(stops)
+        
+        color_func = vtkColorTransferFunction()
+        apply_colormap(color_func, vmin, vmax - vmin)
+        
+        return color_func
+    
+    def cell_data_to_point_data(self, mesh):
+        """Return mesh with cell data averaged to points, converting each mesh object only once"""
+        # Shared by the frame pipeline and the auto-detect actions, which both take their
+        # meshes from load_mesh, so a frame is averaged at most once while it is cached
+        key = id(mesh)
+        entry = self._c2p_cache.get(key)
+        if entry is not None and entry[0]() is mesh:
+            return entry[1]
+        
+        point_mesh = mesh.cell_data_to_point_data()
+        self._c2p_cache[key] = (weakref.ref(mesh), point_mesh)
+        # Drop the entry with the source mesh so ids can be reused safely
+        weakref.finalize(mesh, self._c2p_cache.pop, key, None)
+        return point_mesh
+    
+    def frame_scalar_range(self, frame_index):
+        """Return the (min, max) of the active scalars of a frame, or None if the frame lacks them"""
+        # The auto-detect actions ask for the same frame repeatedly, the full array reduction
+        # (and the cell to point averaging of cell scalars) only runs the first time
+        key = self.mesh_key(frame_index) + (self.active_scalars,)
+        if key in self._range_cache:
+            return self._range_cache[key]
+        
+        # Load the mesh through the mesh cache, only the selected scalars are needed
+        mesh = self.load_mesh(frame_index)
+        
+        # Handle cell data vs point data for selected scalars
+        scalar_name = self.active_scalars
+        if "(cell)" in scalar_name:
+            scalar_name = scalar_name.replace(" (cell)", "")
+            if scalar_name in mesh.cell_data:
+                mesh = self.cell_data_to_point_data(mesh)
+        
+        scalar_range = dvu.scalar_range(mesh, scalar_name) if scalar_name in mesh.point_data else None
+        self._range_cache[key] = scalar_range
+        return scalar_range
+    
+    def shared_cell_locator(self, clipped):
+        """Return a cell locator and float32 points for the clipped mesh, reused while its topology is unchanged"""
+        topology = dvu.topology_hash(clipped)
+        
+        with self._locator_lock:
+            if topology != self._shared_topology:
+                logger.debug("Mesh topology changed, building cell locator...")
+                self._shared_locator = dvu.build_cell_locator(clipped)
+                self._shared_points = dvu.float32_points(clipped)
+                self._shared_topology = topology
+            
+            return self._shared_locator, self._shared_points
+    
+    def shared_uniform_grid(self, clipped, target_cells):
+        """Return the uniform grid for the clipped mesh, built once per bounds and target"""
+        key = tuple(clipped.bounds)
+        
+        with self._locator_lock:
+            # Grids are specialized for the active target cell count, which rarely changes.
+            # When it does, grids for the old count are dropped instead of piling up
+            if target_cells != self._grid_target_cells:
+                self._uniform_grids.clear()
+                self._grid_target_cells = target_cells
+            
+            if key not in self._uniform_grids:
+                self._uniform_grids[key] = dvu.create_uniform_grid(clipped.bounds, target_cells)
+            
+            return self._uniform_grids[key]
+    
+    def prepare_volume_data(self, mesh, active_scalars, bounds, target_cells):
+        """Select scalars, clip and resample mesh to a uniform grid (safe to run off the GUI thread)"""
+        # Handle cell data vs point data for selected scalars
+        scalar_name = active_scalars
+        if "(cell)" in scalar_name:
+            # Remove the "(cell)" suffix and convert cell data to point data
+            scalar_name = scalar_name.replace(" (cell)", "")
+            if scalar_name in mesh.cell_data:
+                mesh = self.cell_data_to_point_data(mesh)
+        else:
+            # For point data, ensure it exists
+            if scalar_name not in mesh.point_data and mesh.active_scalars_name in mesh.cell_data:
+                mesh = self.cell_data_to_point_data(mesh)
+        
+        # Meshes are shared through the mesh cache, work on a shallow copy from here on
+        mesh = mesh.copy(deep=False)
+        
+        # Set the active scalars
         try:
-            # Handle cell data vs point data for selected scalars
-            scalar_name = self.active_scalars
-            if "(cell)" in scalar_name:
-                # Remove the "(cell)" suffix and convert cell data to point data
-                scalar_name = scalar_name.replace(" (cell)", "")
-                if scalar_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
+            mesh.set_active_scalars(scalar_name)
+            logger.debug("Using active scalars: %s", scalar_name)
+        except:
+            # Fallback to default if the selected scalar doesn't exist
+            logger.warning("Scalar '%s' not found, using default", scalar_name)
+            if 'Resistivity(log10)' in mesh.point_data:
+                mesh.set_active_scalars('Resistivity(log10)')
             else:
-                # For point data, ensure it exists
-                if scalar_name not in mesh.point_data and mesh.active_scalars_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
-            
-            # Set the active scalars
-            try:
-                mesh.set_active_scalars(scalar_name)
-                print(f"Using active scalars: {scalar_name}")
-            except:
-                # Fallback to default if the selected scalar doesn't exist
-                print(f"Warning: Scalar '{scalar_name}' not found, using default")
-                if 'Resistivity(log10)' in mesh.point_data:
-                    mesh.set_active_scalars('Resistivity(log10)')
-                else:
-                    # Use the first available scalar
-                    available_scalars = list(mesh.point_data.keys())
-                    if available_scalars:
-                        mesh.set_active_scalars(available_scalars[0])
-                        print(f"Using fallback scalar: {available_scalars[0]}")
-            
-            # Clip mesh
-            clipped = mesh.clip_box(bounds=self.bounds, invert=False)
-            
-            # Resample to uniform grid
-            resampled = dvu.resample_to_uniform_grid(clipped, target_cells=self.target_cells)
-            
+                # Use the first available scalar
+                available_scalars = list(mesh.point_data.keys())
+                if available_scalars:
+                    mesh.set_active_scalars(available_scalars[0])
+                    logger.debug("Using fallback scalar: %s", available_scalars[0])
+        
+        # Clip, resample and upload in single precision, plenty for log10 values
+        name = mesh.active_scalars_name
+        if name in mesh.point_data and mesh.point_data[name].dtype != np.float32:
+            mesh.point_data[name] = mesh.point_data[name].astype(np.float32)
+            mesh.set_active_scalars(name)
+        
+        # Clip mesh
+        clipped = mesh.clip_box(bounds=bounds, invert=False)
+        
+        # Resample to uniform grid. All frames share the inversion mesh, so the cell locator, the float32
+        # points and the empty uniform grid are built once and only the scalars are probed per frame
+        locator, points = self.shared_cell_locator(clipped)
+        resampled = dvu.resample_to_uniform_grid(clipped, target_cells=target_cells, locator=locator,
+                                                 uniform_grid=self.shared_uniform_grid(clipped, target_cells),
+                                                 points=points)
+        
+        # Volume mappers only use the GPU path for ImageData, sample onto one if needed
+        if not isinstance(resampled, pv.ImageData):
+            resampled = self.shared_uniform_grid(clipped, target_cells).sample(clipped)
+        
+        # Grid alignment can take the real cell count somewhat above the target, see dvu.create_uniform_grid
+        logger.debug("Resampled to %s points, %s cells (target %s)", resampled.dimensions, resampled.n_cells,
+                     target_cells)
+        
+        # Reduce the scalar range here, off the GUI thread, and keep it with the (cached) grid
+        if resampled.active_scalars_name is not None:
+            resampled.field_data['scalar_range'] = np.array(
+                dvu.scalar_range(resampled, resampled.active_scalars_name))
+        
+        return resampled
+    
+    def get_volume_property(self, opacity_scale=1.0):
+        """Get the volume property for the current colormap and opacity, built once per colormap and scale"""
+        # The volume scalars are quantized to 0-255 over the data range, see create_volume_actor,
+        # so the color and scalar opacity functions do not depend on the data range
+        key = (self.colormap, opacity_scale)
+        
+        # The gradient opacity function does, through the gradient magnitudes. Every property
+        # shares one instance, refilled in place when the range changes
+        data_range = (self.global_min, self.global_max)
+        if self._gradient_opacity is None:
+            self._gradient_opacity = self.create_gradient_opacity_function(*data_range)
+            self._gradient_opacity_range = data_range
+        elif data_range != self._gradient_opacity_range:
+            self.fill_gradient_opacity_function(self._gradient_opacity, *data_range)
+            self._gradient_opacity_range = data_range
+        
+        opacity = tuple(self.opacity)
+        entry = self._volume_property_cache.get(key)
+        if entry is not None:
+            volume_property, filled_opacity = entry
+            if filled_opacity != opacity:
+                # Opacity edits refill the existing function in place, so the property and its
+                # color texture stay as they are and only the opacity table is uploaded again
+                self.fill_opacity_function(volume_property.GetScalarOpacity(), 0.0, 255.0, scale=opacity_scale)
+                self._volume_property_cache[key] = (volume_property, opacity)
+            return volume_property
+        
+        # Create volume property with enhanced lighting
+        volume_property = vtkVolumeProperty()
+        
+        # Enable shading for realistic lighting, except while scrubbing, see on_scrubbing_changed
+        volume_property.SetShade(not self._scrubbing)
+        volume_property.SetInterpolationTypeToLinear()
+        
+        # Enhanced lighting properties
+        volume_property.SetAmbient(0.2)      # Ambient lighting (base illumination)
+        volume_property.SetDiffuse(0.7)      # Diffuse lighting (directional light scattering)
+        volume_property.SetSpecular(0.3)     # Specular lighting (shiny highlights)
+        volume_property.SetSpecularPower(20) # Specular power (shininess concentration)
+        
+        # Enable gradient opacity for better depth perception, shared by all properties
+        volume_property.SetGradientOpacity(0, self._gradient_opacity)
+        
+        # Set scattering properties for more realistic volume rendering
+        volume_property.SetScalarOpacityUnitDistance(0.5)  # Controls opacity density
+        
+        # Color transfer function, shared between updates with the same colormap and range
+        volume_property.SetColor(self.get_color_function(self.colormap, 0.0, 255.0))
+        
+        # Create opacity transfer function mapped to the quantized range
+        volume_property.SetScalarOpacity(self.create_opacity_function(0.0, 255.0, scale=opacity_scale))
+        
+        # At most one per colormap and opacity scale (full or reduced)
+        self._volume_property_cache[key] = (volume_property, opacity)
+        
+        return volume_property
+    
+    def create_volume_actor(self, mesh, resampled):
+        """Create VTK volume actor from a resampled mesh"""
+        if resampled is None:
+            return self.create_fallback_actor(mesh)
+        
+        try:
             # Calculate data range for the active scalars
             self.update_data_range(resampled)
             
-            # Convert PyVista mesh to VTK ImageData for volume rendering
-            if hasattr(resampled, 'cast_to_image_data'):
-                vtk_data = resampled.cast_to_image_data()
+            # prepare_volume_data guarantees ImageData, which takes the GPU texture path. The
+            # volume gets its own ImageData with the same geometry, so the cached grid keeps
+            # its original scalars
+            structure = (tuple(resampled.dimensions), tuple(resampled.origin), tuple(resampled.spacing))
+            
+            # Quantize the scalars to uint8 over the data range, a quarter of the float32 texture.
+            # The transfer functions in get_volume_property are built over 0-255 to match
+            scalar_name = resampled.active_scalars_name
+            vmax = self.global_max if self.global_max > self.global_min else self.global_min + 1.0
+            if scalar_name is None:
+                vtk_data = vtkImageData()
+                vtk_data.CopyStructure(resampled)
+                self._volume_image = None
+            elif self._volume_image is not None and structure == self._volume_structure:
+                # Same grid as the displayed volume, quantize into its buffer in place. The VTK
+                # array wraps that memory, so it only has to be marked as modified
+                vtk_data = self._volume_image
+                arr = dvu.quantize_to_uint8(resampled.point_data[scalar_name], self.global_min, vmax,
+                                            out=self._scalar_ref)
+                vtk_arr = vtk_data.GetPointData().GetScalars()
+                vtk_arr.SetName(scalar_name)
+                vtk_arr.Modified()
+                vtk_data.Modified()
             else:
-                # Fallback: resampled should be ImageData already from resample_to_uniform_grid
-                vtk_data = resampled
-            
-            print(f"VTK data type: {type(vtk_data)}")
-            print(f"VTK data bounds: {vtk_data.GetBounds()}")
-            print(f"VTK data dimensions: {vtk_data.GetDimensions()}")
+                vtk_data = vtkImageData()
+                vtk_data.CopyStructure(resampled)
+                arr = dvu.quantize_to_uint8(resampled.point_data[scalar_name], self.global_min, vmax)
+                vtk_arr = numpy_support.numpy_to_vtk(arr, deep=False, array_type=VTK_UNSIGNED_CHAR)
+                vtk_arr.SetName(scalar_name)
+                vtk_data.GetPointData().SetScalars(vtk_arr)
+                self._scalar_ref = arr  # VTK does not own the buffer, keep it alive
+                self._volume_image = vtk_data
+                self._volume_structure = structure
+            
+            if scalar_name is not None:
+                # Value range of every slab along each axis, scanned once per frame so
+                # update_volume_cropping only has to compare ranges on opacity changes
+                nx, ny, nz = vtk_data.GetDimensions()
+                self._slab_ranges = dvu.slab_value_ranges(arr.reshape(nz, ny, nx))
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("VTK data type: %s", type(vtk_data))
+                logger.debug("VTK data bounds: %s", vtk_data.GetBounds())
+                logger.debug("VTK data dimensions: %s", vtk_data.GetDimensions())
+            
+            # The mapper and actor are created once and reused, so only the input changes between
+            # frames and the ray caster keeps its compiled shaders and transfer function textures
+            if self._volume_mapper is None:
+                # Volumes are always GPU ray cast, warn once if the context cannot do it. Checked
+                # here rather than at startup, as the query creates the OpenGL context
+                if not self.vtk_widget.render_window.SupportsOpenGL():
+                    logger.warning("OpenGL is not fully supported, volume rendering may fail")
+                
+                # Use the GPU ray caster directly, the smart mapper can silently fall back to the CPU
+                mapper = vtkGPUVolumeRayCastMapper()
+                
+                # Fixed sample distance (set per input below) avoids slab gaps, jitter hides banding
+                mapper.SetAutoAdjustSampleDistances(False)
+                mapper.SetUseJittering(True)
+                
+                # Improve depth testing for volume rendering
+                mapper.SetBlendModeToComposite()  # Use composite blending for better depth handling
+                
+                self._volume_mapper = mapper
+                self._volume_actor = vtkVolume()
+                self._volume_actor.SetMapper(mapper)
             
-            # Create volume mapper
-            mapper = vtk.vtkSmartVolumeMapper()
+            mapper = self._volume_mapper
             mapper.SetInputData(vtk_data)
-            mapper.SetRequestedRenderModeToGPU()  # Use GPU rendering if available
-            
-            # Improve depth testing for volume rendering
-            mapper.SetBlendModeToComposite()  # Use composite blending for better depth handling
-            
-            # Create volume property with enhanced lighting
-            volume_property = vtk.vtkVolumeProperty()
-            
-            # Enable shading for realistic lighting
-            volume_property.ShadeOn()
-            volume_property.SetInterpolationTypeToLinear()
-            
-            # Enhanced lighting properties
-            volume_property.SetAmbient(0.2)      # Ambient lighting (base illumination)
-            volume_property.SetDiffuse(0.7)      # Diffuse lighting (directional light scattering)
-            volume_property.SetSpecular(0.3)     # Specular lighting (shiny highlights)
-            volume_property.SetSpecularPower(20) # Specular power (shininess concentration)
-            
-            # Enable gradient opacity for better depth perception
-            volume_property.SetGradientOpacity(0, self.create_gradient_opacity_function())
-            
-            # Set scattering properties for more realistic volume rendering
-            volume_property.SetScalarOpacityUnitDistance(0.5)  # Controls opacity density
-            
-            # Create color transfer function
-            color_func = vtk.vtkColorTransferFunction()
-            
-            # Set up colormap based on selected colormap
-            if self.colormap == 'RdYlBu_r':
-                # Red-Yellow-Blue reversed
-                color_func.AddRGBPoint(self.global_min, 0.0, 0.0, 1.0)  # Blue
-                color_func.AddRGBPoint(self.global_min + 0.3 * (self.global_max - self.global_min), 0.0, 1.0, 1.0)  # Cyan
-                color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 1.0, 1.0, 0.0)  # Yellow
-                color_func.AddRGBPoint(self.global_min + 0.7 * (self.global_max - self.global_min), 1.0, 0.5, 0.0)  # Orange
-                color_func.AddRGBPoint(self.global_max, 1.0, 0.0, 0.0)  # Red
-            elif self.colormap == 'viridis':
-                # Viridis colormap
-                color_func.AddRGBPoint(self.global_min, 0.267, 0.004, 0.329)  # Dark purple
-                color_func.AddRGBPoint(self.global_min + 0.25 * (self.global_max - self.global_min), 0.229, 0.322, 0.545)  # Purple-blue
-                color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 0.127, 0.566, 0.550)  # Teal
-                color_func.AddRGBPoint(self.global_min + 0.75 * (self.global_max - self.global_min), 0.369, 0.788, 0.382)  # Green
-                color_func.AddRGBPoint(self.global_max, 0.993, 0.906, 0.144)  # Yellow
-            elif self.colormap == 'plasma':
-                # Plasma colormap
-                color_func.AddRGBPoint(self.global_min, 0.050, 0.030, 0.529)  # Dark blue
-                color_func.AddRGBPoint(self.global_min + 0.25 * (self.global_max - self.global_min), 0.494, 0.016, 0.655)  # Purple
-                color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 0.808, 0.067, 0.472)  # Magenta
-                color_func.AddRGBPoint(self.global_min + 0.75 * (self.global_max - self.global_min), 0.965, 0.451, 0.176)  # Orange
-                color_func.AddRGBPoint(self.global_max, 0.984, 0.906, 0.145)  # Yellow
-            elif self.colormap == 'inferno':
-                # Inferno colormap
-                color_func.AddRGBPoint(self.global_min, 0.000, 0.000, 0.014)  # Almost black
-                color_func.AddRGBPoint(self.global_min + 0.25 * (self.global_max - self.global_min), 0.341, 0.062, 0.429)  # Dark purple
-                color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 0.733, 0.216, 0.329)  # Red
-                color_func.AddRGBPoint(self.global_min + 0.75 * (self.global_max - self.global_min), 0.976, 0.576, 0.176)  # Orange
-                color_func.AddRGBPoint(self.global_max, 0.988, 0.998, 0.645)  # Light yellow
-            elif self.colormap == 'jet':
-                # Jet colormap (traditional blue-cyan-yellow-red)
-                color_func.AddRGBPoint(self.global_min, 0.0, 0.0, 0.5)  # Dark blue
-                color_func.AddRGBPoint(self.global_min + 0.2 * (self.global_max - self.global_min), 0.0, 0.0, 1.0)  # Blue
-                color_func.AddRGBPoint(self.global_min + 0.4 * (self.global_max - self.global_min), 0.0, 1.0, 1.0)  # Cyan
-                color_func.AddRGBPoint(self.global_min + 0.6 * (self.global_max - self.global_min), 1.0, 1.0, 0.0)  # Yellow
-                color_func.AddRGBPoint(self.global_min + 0.8 * (self.global_max - self.global_min), 1.0, 0.0, 0.0)  # Red
-                color_func.AddRGBPoint(self.global_max, 0.5, 0.0, 0.0)  # Dark red
-            elif self.colormap == 'rainbow':
-                # Rainbow colormap (spectral colors)
-                color_func.AddRGBPoint(self.global_min, 0.5, 0.0, 1.0)  # Purple
-                color_func.AddRGBPoint(self.global_min + 0.17 * (self.global_max - self.global_min), 0.0, 0.0, 1.0)  # Blue
-                color_func.AddRGBPoint(self.global_min + 0.33 * (self.global_max - self.global_min), 0.0, 1.0, 1.0)  # Cyan
-                color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 0.0, 1.0, 0.0)  # Green
-                color_func.AddRGBPoint(self.global_min + 0.67 * (self.global_max - self.global_min), 1.0, 1.0, 0.0)  # Yellow
-                color_func.AddRGBPoint(self.global_min + 0.83 * (self.global_max - self.global_min), 1.0, 0.5, 0.0)  # Orange
-                color_func.AddRGBPoint(self.global_max, 1.0, 0.0, 0.0)  # Red
-            else:
-                # Default fallback to RdYlBu_r if unknown colormap
-                color_func.AddRGBPoint(self.global_min, 0.0, 0.0, 1.0)  # Blue
-                color_func.AddRGBPoint(self.global_min + 0.3 * (self.global_max - self.global_min), 0.0, 1.0, 1.0)  # Cyan
-                color_func.AddRGBPoint(self.global_min + 0.5 * (self.global_max - self.global_min), 1.0, 1.0, 0.0)  # Yellow
-                color_func.AddRGBPoint(self.global_min + 0.7 * (self.global_max - self.global_min), 1.0, 0.5, 0.0)  # Orange
-                color_func.AddRGBPoint(self.global_max, 1.0, 0.0, 0.0)  # Red
-            
-            volume_property.SetColor(color_func)
+            mapper.SetSampleDistance(float(np.linalg.norm(vtk_data.GetSpacing())) / 2)  # Half a voxel diagonal
+            self.update_volume_cropping()
             
-            # Create opacity transfer function
-            opacity_func = vtk.vtkPiecewiseFunction()
-            
-            # Map opacity values to data range
-            data_range = self.global_max - self.global_min
-            for i, opacity_val in enumerate(self.opacity):
-                if data_range > 0:
-                    value = self.global_min + (i / max(1, len(self.opacity) - 1)) * data_range
-                    opacity_func.AddPoint(value, opacity_val)
-            
-            volume_property.SetScalarOpacity(opacity_func)
-            
-            # Create volume actor
-            volume_actor = vtk.vtkVolume()
-            volume_actor.SetMapper(mapper)
-            volume_actor.SetProperty(volume_property)
+            volume_actor = self._volume_actor
+            volume_actor.SetProperty(self.get_volume_property())
             
             # Store color function for scalar bar
-            self.current_color_function = color_func
+            self.current_color_function = self.get_color_function(self.colormap, self.global_min, self.global_max)
             
-            # Print volume bounds for debugging
-            bounds = volume_actor.GetBounds()
-            print(f"Volume actor bounds: {bounds}")
+            # Log volume bounds for debugging, GetBounds() is only queried when DEBUG is enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Volume actor bounds: %s", volume_actor.GetBounds())
             
             return volume_actor
             
         except Exception as e:
-            print(f"Error creating volume actor: {e}")
+            logger.error("Error creating volume actor: %s", e)
             # Return a simple wireframe as fallback
             return self.create_fallback_actor(mesh)
     
+    def update_volume_cropping(self):
+        """Crop ray casting to the box around the voxels that are visible with the current opacity"""
+        mapper = self._volume_mapper
+        if mapper is None or self._slab_ranges is None:
+            return
+        
+        # Visibility of each of the 256 quantized values, as a running count so a value
+        # range [lo, hi] holds a visible value when visible_count[hi + 1] > visible_count[lo]
+        n_points = len(self.opacity)
+        visible_values = np.interp(np.arange(256), np.linspace(0.0, 255.0, n_points), self.opacity) > 0
+        if not visible_values.any():
+            mapper.CroppingOff()
+            return
+        visible_count = np.concatenate(([0], np.cumsum(visible_values)))
+        
+        # Index range of slabs that may hold visible voxels per axis, one voxel wider for
+        # interpolation at the edges
+        image = mapper.GetInput()
+        origin = image.GetOrigin()
+        spacing = image.GetSpacing()
+        planes = []
+        for axis, (dim, (slab_min, slab_max)) in enumerate(zip(image.GetDimensions(), self._slab_ranges)):
+            indices = np.flatnonzero(visible_count[slab_max.astype(np.intp) + 1] > visible_count[slab_min])
+            if indices.size == 0:
+                mapper.CroppingOff()
+                return
+            lo = max(int(indices[0]) - 1, 0)
+            hi = min(int(indices[-1]) + 1, dim - 1)
+            
+            # Also crop to the clip bounds, which may be tighter than the resampled grid
+            # while a bounds change is previewed, see apply_parameter_changes
+            lo_plane = max(origin[axis] + lo * spacing[axis], self.bounds[2 * axis])
+            hi_plane = min(origin[axis] + hi * spacing[axis], self.bounds[2 * axis + 1])
+            planes += [lo_plane, max(lo_plane, hi_plane)]
+        
+        # Rays skip the fully transparent space outside the box
+        mapper.SetCroppingRegionPlanes(*planes)
+        mapper.SetCroppingRegionFlagsToSubVolume()
+        mapper.CroppingOn()
+    
     def create_fallback_actor(self, mesh):
         """Create a fallback wireframe actor if volume rendering fails"""
         try:
-            # Clip mesh
-            clipped = mesh.clip_box(bounds=self.bounds, invert=False)
-            
-            # Convert to VTK PolyData
-            surface = clipped.extract_surface()
-            vtk_polydata = surface
-            
-            # Create mapper
-            mapper = vtk.vtkPolyDataMapper()
+            # Clip mesh, one side only and without crinkling whole cells
+            clipped = mesh.clip_box(bounds=self.bounds, invert=False, crinkle=False)
+            
+            # Convert to VTK PolyData, the wireframe only shows the outer surface and
+            # does not need the point merging pass of extract_surface
+            geometry_filter = vtkGeometryFilter()
+            geometry_filter.SetInputData(clipped)
+            geometry_filter.SetMerging(False)
+            geometry_filter.SetFastMode(True)
+            geometry_filter.Update()
+            vtk_polydata = geometry_filter.GetOutput()
+            
+            # Create mapper, its input never changes so VTK can skip pipeline update checks
+            mapper = vtkPolyDataMapper()
             mapper.SetInputData(vtk_polydata)
             mapper.SetScalarRange(self.global_min, self.global_max)
+            mapper.SetStatic(True)
+            
+            # Color by the selected colormap, reusing the cached transfer function as lookup table
+            mapper.SetLookupTable(self.get_color_function(self.colormap, self.global_min, self.global_max))
             
             # Create actor
-            actor = vtk.vtkActor()
+            actor = vtkActor()
             actor.SetMapper(mapper)
             actor.GetProperty().SetRepresentationToWireframe()
             actor.GetProperty().SetColor(1.0, 0.5, 0.0)  # Orange
@@ -1481,7 +2059,7 @@ class DamVisualizationApp(QMainWindow):
             return actor
             
         except Exception as e:
-            print(f"Error creating fallback actor: {e}")
+            logger.error("Error creating fallback actor: %s", e)
             return None
     
     def update_data_range(self, mesh):
@@ -1489,8 +2067,11 @@ class DamVisualizationApp(QMainWindow):
         try:
             # Get the active scalar array
             if mesh.active_scalars is not None:
-                # Get auto-detected range
-                auto_min, auto_max = mesh.active_scalars.min(), mesh.active_scalars.max()
+                # Get auto-detected range, precomputed by prepare_volume_data when available
+                if 'scalar_range' in mesh.field_data:
+                    auto_min, auto_max = (float(v) for v in mesh.field_data['scalar_range'])
+                else:
+                    auto_min, auto_max = dvu.scalar_range(mesh, mesh.active_scalars_name)
                 
                 # Get manual data range from control panel
                 manual_min = self.control_panel.get_data_min()
@@ -1505,24 +2086,24 @@ class DamVisualizationApp(QMainWindow):
                     # User has manually changed values, use them
                     self.global_min = manual_min
                     self.global_max = manual_max
-                    print(f"Using manual data range for '{mesh.active_scalars_name}': [{self.global_min:.3f}, {self.global_max:.3f}]")
+                    logger.debug("Using manual data range for '%s': [%.3f, %.3f]", mesh.active_scalars_name, self.global_min, self.global_max)
                 else:
                     # Use auto-detected values and update spinboxes to match
                     self.global_min, self.global_max = auto_min, auto_max
                     # Update spinboxes to reflect the auto-detected values
                     self.control_panel.data_min_spinbox.setValue(auto_min)
                     self.control_panel.data_max_spinbox.setValue(auto_max)
-                    print(f"Using auto-detected data range for '{mesh.active_scalars_name}': [{self.global_min:.3f}, {self.global_max:.3f}]")
+                    logger.debug("Using auto-detected data range for '%s': [%.3f, %.3f]", mesh.active_scalars_name, self.global_min, self.global_max)
                 
                 # Update the control panel min/max labels if the range changed significantly
                 if abs(old_min - self.global_min) > 0.001 or abs(old_max - self.global_max) > 0.001:
                     self.control_panel.update_minmax_labels(self.global_min, self.global_max)
                     
             else:
-                print("Warning: No active scalars found, keeping existing data range")
+                logger.warning("No active scalars found, keeping existing data range")
                 
         except Exception as e:
-            print(f"Error updating data range: {e}")
+            logger.error("Error updating data range: %s", e)
     
     def create_bounds_actor(self):
         """Create ParaView-style axes grid for bounding box"""
@@ -1533,7 +2114,7 @@ class DamVisualizationApp(QMainWindow):
         xmin, xmax, ymin, ymax, zmin, zmax = self.bounds
         
         # Create cube axes actor (ParaView-style grid)
-        cube_axes = vtk.vtkCubeAxesActor()
+        cube_axes = vtkCubeAxesActor()
         cube_axes.SetBounds(self.bounds)
         cube_axes.SetCamera(self.vtk_widget.renderer.GetActiveCamera())
         
@@ -1571,7 +2152,7 @@ class DamVisualizationApp(QMainWindow):
         cube_axes.SetZAxisLabelVisibility(True)
         
         # Grid lines properties
-        cube_axes.SetGridLineLocation(vtk.vtkCubeAxesActor.VTK_GRID_LINES_ALL)
+        cube_axes.SetGridLineLocation(vtkCubeAxesActor.VTK_GRID_LINES_ALL)
         cube_axes.GetXAxesGridlinesProperty().SetColor(0.3, 0.3, 0.3)  # Dark gray
         cube_axes.GetYAxesGridlinesProperty().SetColor(0.3, 0.3, 0.3)
         cube_axes.GetZAxesGridlinesProperty().SetColor(0.3, 0.3, 0.3)
@@ -1588,43 +2169,223 @@ class DamVisualizationApp(QMainWindow):
         
         return cube_axes
     
-    def update_visualization(self, frame_index):
-        """Update visualization for given frame"""
+    def update_visualization(self, frame_index, background=False):
+        """Update visualization for given frame, resampling on a worker thread if background is set"""
         if not self.vtk_files or frame_index not in self.vtk_files:
             return
         
         try:
-            # Remove existing actors
-            self.vtk_widget.remove_all_actors()
-            
-            # Update lighting setup
-            self.vtk_widget.setup_enhanced_lighting(self.lighting_quality)
-            
-            # Load mesh
-            file_path = os.path.join(self.data_location, self.vtk_files[frame_index])
-            mesh = pv.read(file_path)
-            # Active scalars will be set in create_volume_actor based on user selection
-            
             # Determine if volume should be shown (considering auto-hide feature)
             should_show_volume = self.show_volume
             if self.auto_hide_volume and self.show_isosurfaces and self.iso_opacity >= 0.9:
                 should_show_volume = False
-                print(f"Auto-hiding volume due to opaque isosurfaces (opacity: {self.iso_opacity})")
+                logger.debug("Auto-hiding volume due to opaque isosurfaces (opacity: %s)", self.iso_opacity)
+            
+            # Any result still in flight is now stale
+            self._job_seq += 1
+            
+            # Start reading the next frames while this one is processed
+            self.prefetch_meshes(frame_index)
+            
+            # Resampled volumes are reused as long as the resampling parameters are unchanged
+            cache_key = (frame_index, self.active_scalars, tuple(self.bounds), self.target_cells)
+            resampled = self._frame_cache.get(cache_key) if should_show_volume else None
+            if resampled is not None:
+                self._frame_cache.move_to_end(cache_key)
+            
+            # The mesh is needed unless the cached volume is all that is shown
+            need_mesh = resampled is None or self.show_isosurfaces
+            need_resample = should_show_volume and resampled is None
+            mesh_key = self.mesh_key(frame_index)
+            
+            if background and (need_resample or (need_mesh and mesh_key not in self._mesh_cache)):
+                # Read (unless cached), clip and resample off the GUI thread, the result is
+                # delivered to on_volume_resampled
+                mesh = self._mesh_cache.get(mesh_key)
+                mesh_future = None if mesh is not None else self.read_mesh_async(mesh_key)
+                self._pending_frame = (frame_index, should_show_volume, cache_key, resampled)
+                worker = ResampleWorker(self._job_seq, self.prepare_frame, self._job_seq, mesh_key, mesh,
+                                        mesh_future, need_resample, self.active_scalars, list(self.bounds),
+                                        self.target_cells)
+                worker.signals.finished.connect(self.on_volume_resampled)
+                self._thread_pool.start(worker)
+                
+                self.statusBar().showMessage(f"Loading frame {frame_index}...")
+                return
+            
+            # Load mesh unless the cached volume is all that is needed
+            mesh = None
+            if need_mesh:
+                mesh = self.load_mesh(frame_index)
+                # Active scalars will be set in prepare_volume_data based on user selection
+            
+            if need_resample:
+                resampled = self.prepare_volume_data(mesh, self.active_scalars, list(self.bounds), self.target_cells)
+                self.cache_frame(cache_key, resampled)
+            
+            self.display_frame(frame_index, mesh, should_show_volume, resampled)
+            
+        except (OSError, RuntimeError, ValueError) as e:
+            self.report_frame_error(f"Failed to update visualization: {e}")
+    
+    def prepare_frame(self, job_id, mesh_key, mesh, mesh_future, resample, active_scalars, bounds, target_cells):
+        """Wait for the mesh read if needed and prepare its volume data if resample is set (runs on a worker thread)"""
+        if mesh is None:
+            mesh = mesh_future.result()
+        
+        # Jobs superseded while queued or reading are cancelled before the expensive resample,
+        # so a fast slider drag does not leave a backlog of stale frames to work through
+        if not resample or job_id != self._job_seq:
+            return mesh_key, mesh, None
+        
+        return mesh_key, mesh, self.prepare_volume_data(mesh, active_scalars, bounds, target_cells)
+    
+    def request_update(self, frame_index):
+        """Schedule a background update of frame_index, coalescing requests that arrive within one timer interval"""
+        self._pending_update_frame = frame_index
+        self._update_timer.start()
+    
+    def _do_update(self):
+        """Run the most recently requested update"""
+        frame_index = self._pending_update_frame
+        self._pending_update_frame = None
+        if frame_index is not None:
+            self.update_visualization(frame_index, background=True)
+    
+    def on_volume_resampled(self, job_id, result):
+        """Display a frame once its mesh has been read and, if needed, its volume data resampled"""
+        if result is None:
+            if job_id == self._job_seq:
+                self._pending_frame = None
+                self.report_frame_error("Failed to prepare frame")
+            return
+        
+        # The mesh is worth keeping even if the frame itself is stale
+        mesh_key, mesh, resampled = result
+        self.cache_mesh(mesh_key, mesh)
+        
+        if job_id != self._job_seq or self._pending_frame is None:
+            # A newer update has been requested since this job started
+            return
+        
+        frame_index, should_show_volume, cache_key, cached_resampled = self._pending_frame
+        self._pending_frame = None
+        if cached_resampled is not None:
+            # Only the mesh was read, the volume came from the frame cache
+            resampled = cached_resampled
+        else:
+            self.cache_frame(cache_key, resampled)
+        self.display_frame(frame_index, mesh, should_show_volume, resampled)
+    
+    def mesh_key(self, frame_index):
+        """Return the mesh cache key of a frame, (file path, scalar name)"""
+        file_path = os.path.join(self.data_location, self.vtk_files[frame_index])
+        return (file_path, self.active_scalars.replace(" (cell)", ""))
+    
+    def read_mesh_async(self, mesh_key):
+        """Return a Future of a mesh read, taking over a prefetched read if there is one"""
+        future = self._prefetch.pop(mesh_key, None)
+        if future is None or future.cancelled():
+            future = self._prefetch_pool.submit(dvu.read_mesh, *mesh_key)
+        return future
+    
+    def cache_mesh(self, mesh_key, mesh):
+        """Store a mesh read from disk, evicting the least recently used ones when full"""
+        self._mesh_cache[mesh_key] = mesh
+        self._mesh_cache.move_to_end(mesh_key)
+        
+        # Always keep the newest mesh, however large
+        while len(self._mesh_cache) > 1 and (
+                len(self._mesh_cache) > MESH_CACHE_SIZE
+                or sum(m.actual_memory_size for m in self._mesh_cache.values()) > MESH_CACHE_MEMORY_KB):
+            self._mesh_cache.popitem(last=False)
+    
+    def load_mesh(self, frame_index):
+        """Read the selected scalars of a frame, reusing recently read meshes"""
+        mesh_key = self.mesh_key(frame_index)
+        
+        mesh = self._mesh_cache.get(mesh_key)
+        if mesh is None:
+            # Take over a prefetched read if there is one, waiting for it if still running
+            mesh = self.read_mesh_async(mesh_key).result()
+        self.cache_mesh(mesh_key, mesh)
+        
+        return mesh
+    
+    def prefetch_meshes(self, frame_index, count=PREFETCH_FRAMES):
+        """Read the frames around frame_index on background threads, nearest first"""
+        frames = self._frame_indices
+        position = int(np.searchsorted(frames, frame_index))
+        
+        # Scrubbing goes both ways, so alternate between the next and previous frames
+        neighbors = []
+        for offset in range(1, count + 1):
+            neighbors += [position + offset, position - offset]
+        wanted = [self.mesh_key(int(frames[i])) for i in neighbors if 0 <= i < len(frames)]
+        
+        # Drop prefetches the user has moved away from, a read of frame_index itself is
+        # about to be taken over by load_mesh or read_mesh_async
+        keep = set(wanted)
+        keep.add(self.mesh_key(frame_index))
+        for key in list(self._prefetch):
+            if key not in keep:
+                self._prefetch.pop(key).cancel()
+        
+        # Only file reading happens on the workers, the results are picked up by load_mesh
+        for key in wanted:
+            if key not in self._mesh_cache and key not in self._prefetch:
+                self._prefetch[key] = self._prefetch_pool.submit(dvu.read_mesh, *key)
+    
+    def cache_frame(self, cache_key, resampled):
+        """Store a resampled volume, evicting the least recently used one when full"""
+        if resampled is None:
+            return
+        self._frame_cache[cache_key] = resampled
+        self._frame_cache.move_to_end(cache_key)
+        while len(self._frame_cache) > FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+    
+    def display_frame(self, frame_index, mesh, should_show_volume, resampled):
+        """Replace the scene with actors for a loaded (and possibly resampled) frame"""
+        try:
+            # Isosurface actors are pooled and stay in the scene, they are hidden here and the
+            # ones needed for this frame are shown again with the new surfaces. The volume actor,
+            # bounds and color bar stay in the scene as well and are only updated.
+            for iso_actor in self.current_iso_actors:
+                iso_actor.VisibilityOff()
+            self.current_iso_actors = []
+            
+            # Update lighting setup when it changed
+            if self.lighting_quality != self._applied_lighting_quality:
+                self.vtk_widget.setup_enhanced_lighting(self.lighting_quality)
+                self._applied_lighting_quality = self.lighting_quality
+            
+            # Create volume actor if enabled, the reused volume actor is only added once. Removing
+            # it would release its textures on the GPU, so it is hidden while the volume is off
+            previous_volume_actor = self.current_volume_actor
+            self.current_volume_actor = self.create_volume_actor(mesh, resampled) if should_show_volume else None
+            if previous_volume_actor is not self.current_volume_actor:
+                if previous_volume_actor is not None and previous_volume_actor is self._volume_actor:
+                    previous_volume_actor.VisibilityOff()
+                else:
+                    self.vtk_widget.remove_actor(previous_volume_actor)
+                
+                if (self.current_volume_actor is not None and self.current_volume_actor is self._volume_actor
+                        and self.vtk_widget.renderer.HasViewProp(self._volume_actor)):
+                    self._volume_actor.VisibilityOn()
+                else:
+                    self.vtk_widget.add_volume_actor(self.current_volume_actor)
             
-            # Create volume actor if enabled
             if should_show_volume:
-                self.current_volume_actor = self.create_volume_actor(mesh)
                 if self.current_volume_actor:
-                    self.vtk_widget.add_volume_actor(self.current_volume_actor)
-                    print(f"Volume actor created and added for frame {frame_index}")
+                    logger.debug("Volume actor created and added for frame %s", frame_index)
                 else:
-                    print(f"Failed to create volume actor for frame {frame_index}")
+                    logger.warning("Failed to create volume actor for frame %s", frame_index)
             else:
-                self.current_volume_actor = None
                 if not self.show_volume:
-                    print(f"Volume rendering disabled for frame {frame_index}")
+                    logger.debug("Volume rendering disabled for frame %s", frame_index)
                 else:
-                    print(f"Volume rendering auto-hidden for frame {frame_index}")
+                    logger.debug("Volume rendering auto-hidden for frame %s", frame_index)
             
             # Create isosurface actors if enabled
             if self.show_isosurfaces:
@@ -1635,60 +2396,91 @@ class DamVisualizationApp(QMainWindow):
                         iso_actor.GetProperty().SetRenderLinesAsTubes(False)
                         iso_actor.GetProperty().SetRenderPointsAsSpheres(False)
                         
-                        self.vtk_widget.add_volume_actor(iso_actor)  # Use add_volume_actor for regular actors too
-                    print(f"{len(self.current_iso_actors)} isosurface actor(s) created and added for frame {frame_index}")
+                        if not self.vtk_widget.renderer.HasViewProp(iso_actor):
+                            self.vtk_widget.add_volume_actor(iso_actor)  # Use add_volume_actor for regular actors too
+                        iso_actor.VisibilityOn()
+                    logger.debug("%s isosurface actor(s) created and added for frame %s", len(self.current_iso_actors), frame_index)
                     
                     # If we have both volume and isosurfaces, adjust volume opacity when isosurfaces are opaque
                     if self.show_volume and self.current_volume_actor and self.iso_opacity >= 0.8:
-                        # Reduce volume opacity when isosurfaces are nearly opaque to reduce bleeding
-                        volume_property = self.current_volume_actor.GetProperty()
-                        current_opacity_func = volume_property.GetScalarOpacity()
-                        
-                        # Scale down the volume opacity slightly
-                        scaled_opacity_func = vtk.vtkPiecewiseFunction()
-                        for i, opacity_val in enumerate(self.opacity):
-                            if self.global_max > self.global_min:
-                                value = self.global_min + (i / max(1, len(self.opacity) - 1)) * (self.global_max - self.global_min)
-                                # Reduce volume opacity by 30% when isosurfaces are present and opaque
-                                scaled_opacity_func.AddPoint(value, opacity_val * 0.7)
-                        
-                        volume_property.SetScalarOpacity(scaled_opacity_func)
-                        print("Reduced volume opacity to prevent bleeding through opaque isosurfaces")
+                        # Reduce volume opacity by 30% when isosurfaces are present and opaque
+                        self.current_volume_actor.SetProperty(self.get_volume_property(opacity_scale=0.7))
+                        logger.debug("Reduced volume opacity to prevent bleeding through opaque isosurfaces")
                 else:
-                    print(f"Failed to create isosurface actors for frame {frame_index}")
+                    logger.warning("Failed to create isosurface actors for frame %s", frame_index)
             else:
                 self.current_iso_actors = []
             
-            # Add bounds with ParaView-style axes grid if enabled
+            # Add bounds with ParaView-style axes grid if enabled. The grid is built once, only
+            # moved when the bounds change and hidden rather than removed when disabled, so its
+            # axes are not regenerated every frame or toggle
+            bounds_key = tuple(self.bounds)
             if self.show_bounds:
-                self.bounds_actor = self.create_bounds_actor()
-                if self.bounds_actor:
+                if self.bounds_actor is None:
+                    self.bounds_actor = self.create_bounds_actor()
                     self.vtk_widget.add_cube_axes_actor(self.bounds_actor)
-            
-            # Add color bar if enabled and we have a volume actor with color function
-            if self.show_colorbar and self.current_volume_actor and self.current_color_function:
-                # Clean up the scalar name for display (remove "(cell)" suffix if present)
-                display_name = self.active_scalars.replace(" (cell)", "")
-                self.vtk_widget.add_scalar_bar(
-                    color_function=self.current_color_function,
-                    data_range=[self.global_min, self.global_max],
-                    title=display_name,
-                    show_bar=True
-                )
-            
-            # Reset camera to fit the new content and render
-            self.vtk_widget.reset_camera()
+                elif bounds_key != self._bounds_actor_bounds:
+                    self.bounds_actor.SetBounds(self.bounds)
+                self._bounds_actor_bounds = bounds_key
+                self.bounds_actor.VisibilityOn()
+            elif self.bounds_actor is not None:
+                self.bounds_actor.VisibilityOff()
+            
+            # Add or update color bar if enabled and we have a volume actor with color function
+            self.update_scalar_bar()
+            
+            # Fit the camera only on first display or when the bounds change; otherwise keep
+            # the user's view. All content lies within the unchanged bounds and the interactor
+            # resets the clipping range whenever the camera moves, so no props are traversed
+            if bounds_key != self._camera_bounds:
+                self.vtk_widget.renderer.ResetCamera()
+                self._camera_bounds = bounds_key
             self.vtk_widget.render()
             
+            self.error_label.setVisible(False)
             self.statusBar().showMessage(f"Displaying frame {frame_index}: {self.vtk_files[frame_index]}")
             
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update visualization: {str(e)}")
+        except (OSError, RuntimeError, ValueError) as e:
+            self.report_frame_error(f"Failed to update visualization: {e}")
+    
+    def report_frame_error(self, message):
+        """Log a failed frame update and show it in the status bar without interrupting the user"""
+        logger.error("%s", message, exc_info=sys.exc_info()[0] is not None)
+        self.statusBar().showMessage(message, 5000)
+        self.error_label.setToolTip(message)
+        self.error_label.setVisible(True)
+    
+    def on_scrubbing_changed(self, scrubbing):
+        """Drop volume shading while the frame slider is dragged and restore it on release"""
+        # Shading samples the gradient at every ray step, unshaded frames keep dragging smooth
+        self._scrubbing = scrubbing
+        for volume_property, _ in self._volume_property_cache.values():
+            volume_property.SetShade(not scrubbing)
+        
+        # Frames shown while scrubbing use the isosurface levels of detail, the release
+        # renders the current frame at full detail again
+        self.vtk_widget.set_interactive(scrubbing)
+        self.vtk_widget.request_render()
+    
+    def update_scalar_bar(self):
+        """Update the color bar for the current color function, hiding it when there is nothing to show"""
+        show_bar = bool(self.show_colorbar and self.current_volume_actor and self.current_color_function)
+        # Clean up the scalar name for display (remove "(cell)" suffix if present)
+        display_name = self.active_scalars.replace(" (cell)", "")
+        self.vtk_widget.add_scalar_bar(
+            color_function=self.current_color_function,
+            data_range=[self.global_min, self.global_max],
+            title=display_name,
+            show_bar=show_bar
+        )
     
     def apply_parameter_changes(self):
         """Apply all parameter changes from the control panel"""
+        dirty_flags = self.control_panel.dirty_flags()
+        previous_iso_opacity = self.iso_opacity
+        
         # Get current values from control panel
-        self.opacity = self.control_panel.get_opacity_values()
+        self.opacity = self.control_panel.get_opacity_values().copy()  # The panel reuses its buffer
         self.bounds = self.control_panel.get_bounds_values()
         self.colormap = self.control_panel.get_colormap()
         self.active_scalars = self.control_panel.get_active_scalars()
@@ -1707,8 +2499,44 @@ class DamVisualizationApp(QMainWindow):
         self.lighting_quality = self.control_panel.get_lighting_quality()
         current_frame = self.control_panel.get_current_frame()
         
+        # Only the opacity and/or colormap changed, swap the transfer functions and keep the
+        # uploaded volume. Isosurfaces are colored by the colormap, so with isosurfaces shown
+        # a colormap change takes the full update
+        transfer_flags = ControlPanel.DIRTY_OPACITY | ControlPanel.DIRTY_COLORMAP
+        transfer_only = dirty_flags and not dirty_flags & ~transfer_flags
+        if (transfer_only and isinstance(self.current_volume_actor, vtkVolume)
+                and not (dirty_flags & ControlPanel.DIRTY_COLORMAP and self.current_iso_actors)):
+            reduce_opacity = self.show_isosurfaces and self.current_iso_actors and self.iso_opacity >= 0.8
+            self.current_volume_actor.SetProperty(self.get_volume_property(opacity_scale=0.7 if reduce_opacity else 1.0))
+            if dirty_flags & ControlPanel.DIRTY_OPACITY:
+                self.update_volume_cropping()
+            if dirty_flags & ControlPanel.DIRTY_COLORMAP:
+                self.current_color_function = self.get_color_function(self.colormap, self.global_min, self.global_max)
+                self.update_scalar_bar()
+            self.vtk_widget.request_render()
+            self.statusBar().showMessage("Transfer functions applied")
+            return
+        
+        # Only the isosurface opacity changed and it stays on the same side of the volume
+        # auto-hide and opacity reduction thresholds, set it on the displayed actors
+        if (dirty_flags == ControlPanel.DIRTY_ISO_OPACITY and self.current_iso_actors
+                and (previous_iso_opacity >= 0.8) == (self.iso_opacity >= 0.8)
+                and (previous_iso_opacity >= 0.9) == (self.iso_opacity >= 0.9)):
+            iso_opacity = self.isosurface_opacity(len(self.isosurface_values()))
+            for iso_actor in self.current_iso_actors:
+                iso_actor.GetProperty().SetOpacity(iso_opacity)
+            self.vtk_widget.request_render()
+            self.statusBar().showMessage("Isosurface opacity applied")
+            return
+        
+        # Only the bounds changed, preview them by cropping the displayed volume on the GPU
+        # while the frame is clipped and resampled to the new bounds in the background
+        if dirty_flags == ControlPanel.DIRTY_BOUNDS and isinstance(self.current_volume_actor, vtkVolume):
+            self.update_volume_cropping()
+            self.vtk_widget.request_render()
+        
         # Update visualization with current frame
-        self.update_visualization(current_frame)
+        self.request_update(current_frame)
         
         self.statusBar().showMessage("Parameters applied successfully")
 
@@ -1734,7 +2562,7 @@ class DamVisualizationApp(QMainWindow):
             image_number = 0
 
             # Render each frame and save as image
-            for frame_index in sorted(self.vtk_files.keys()):
+            for frame_index in self.vtk_files:
                 self.update_visualization(frame_index)
                 image_path = os.path.join(temp_dir, f"frame_{image_number:04d}.png")
                 self.vtk_widget.capture_screenshot(image_path)
@@ -1768,21 +2596,10 @@ class DamVisualizationApp(QMainWindow):
                 print(f"Frame {current_frame} not found")
                 return
             
-            # Load the current mesh
-            file_path = os.path.join(self.data_location, self.vtk_files[current_frame])
-            mesh = pv.read(file_path)
-            
-            # Handle cell data vs point data for selected scalars
-            scalar_name = self.active_scalars
-            if "(cell)" in scalar_name:
-                scalar_name = scalar_name.replace(" (cell)", "")
-                if scalar_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
-            
-            # Get the scalar data
-            if scalar_name in mesh.point_data:
-                data = mesh.point_data[scalar_name]
-                auto_min = float(np.nanmin(data))
+            # Get the scalar range, computed once per frame and scalar
+            scalar_range = self.frame_scalar_range(current_frame)
+            if scalar_range is not None:
+                auto_min = scalar_range[0]
                 
                 # Update the control panel spinbox
                 self.control_panel.data_min_spinbox.setValue(auto_min)
@@ -1791,7 +2608,7 @@ class DamVisualizationApp(QMainWindow):
                 # Trigger full update to recreate color function and scalar bar
                 self.apply_parameter_changes()
             else:
-                print(f"Scalar '{scalar_name}' not found in mesh data")
+                print(f"Scalar '{self.active_scalars}' not found in mesh data")
                     
         except Exception as e:
             print(f"Error auto-detecting minimum: {e}")
@@ -1809,21 +2626,10 @@ class DamVisualizationApp(QMainWindow):
                 print(f"Frame {current_frame} not found")
                 return
             
-            # Load the current mesh
-            file_path = os.path.join(self.data_location, self.vtk_files[current_frame])
-            mesh = pv.read(file_path)
-            
-            # Handle cell data vs point data for selected scalars
-            scalar_name = self.active_scalars
-            if "(cell)" in scalar_name:
-                scalar_name = scalar_name.replace(" (cell)", "")
-                if scalar_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
-            
-            # Get the scalar data
-            if scalar_name in mesh.point_data:
-                data = mesh.point_data[scalar_name]
-                auto_max = float(np.nanmax(data))
+            # Get the scalar range, computed once per frame and scalar
+            scalar_range = self.frame_scalar_range(current_frame)
+            if scalar_range is not None:
+                auto_max = scalar_range[1]
                 
                 # Update the control panel spinbox
                 self.control_panel.data_max_spinbox.setValue(auto_max)
@@ -1832,7 +2638,7 @@ class DamVisualizationApp(QMainWindow):
                 # Trigger full update to recreate color function and scalar bar
                 self.apply_parameter_changes()
             else:
-                print(f"Scalar '{scalar_name}' not found in mesh data")
+                print(f"Scalar '{self.active_scalars}' not found in mesh data")
                     
         except Exception as e:
             print(f"Error auto-detecting maximum: {e}")
@@ -1850,22 +2656,10 @@ class DamVisualizationApp(QMainWindow):
                 print(f"Frame {current_frame} not found")
                 return
             
-            # Load the current mesh
-            file_path = os.path.join(self.data_location, self.vtk_files[current_frame])
-            mesh = pv.read(file_path)
-            
-            # Handle cell data vs point data for selected scalars
-            scalar_name = self.active_scalars
-            if "(cell)" in scalar_name:
-                scalar_name = scalar_name.replace(" (cell)", "")
-                if scalar_name in mesh.cell_data:
-                    mesh = mesh.cell_data_to_point_data()
-            
-            # Get the scalar data
-            if scalar_name in mesh.point_data:
-                data = mesh.point_data[scalar_name]
-                auto_min = float(np.nanmin(data))
-                auto_max = float(np.nanmax(data))
+            # Get the scalar range, computed once per frame and scalar
+            scalar_range = self.frame_scalar_range(current_frame)
+            if scalar_range is not None:
+                auto_min, auto_max = scalar_range
                 
                 # Update the control panel spinboxes
                 self.control_panel.data_min_spinbox.setValue(auto_min)
@@ -1875,7 +2669,7 @@ class DamVisualizationApp(QMainWindow):
                 # Trigger full update to recreate color function and scalar bar
                 self.apply_parameter_changes()
             else:
-                print(f"Scalar '{scalar_name}' not found in mesh data")
+                print(f"Scalar '{self.active_scalars}' not found in mesh data")
                     
         except Exception as e:
             print(f"Error auto-detecting range: {e}")
@@ -1883,6 +2677,8 @@ class DamVisualizationApp(QMainWindow):
 
 def main():
     """Main function"""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    
     app = QApplication(sys.argv)
     
     # Set application properties
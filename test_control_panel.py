@@ -2,6 +2,7 @@
 """Simple test script for the Qt control panel without VTK dependencies"""
 
 import sys
+import types
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
 from PyQt5.QtCore import pyqtSlot
 
@@ -18,7 +19,7 @@ class MockDamvisUtils:
 sys.modules['damvis_utils'] = MockDamvisUtils()
 
 # Mock VTK and PyVista to avoid import errors
-class MockVTK:
+class MockVTK(types.ModuleType):
     class vtkRenderer:
         def SetBackground(self, r, g, b): pass
         def GetActiveCamera(self): return MockVTK.vtkCamera()
@@ -45,11 +46,22 @@ class MockVTK:
     class vtkInteractor:
         def Initialize(self): pass
         def Start(self): pass
+    
+    def __getattr__(self, name):
+        # Any other VTK class or constant the visualizer imports
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return type(name, (), {})
 
-sys.modules['vtk'] = MockVTK()
-sys.modules['vtk.qt'] = MockVTK()
-sys.modules['vtk.qt.QVTKRenderWindowInteractor'] = MockVTK()
-sys.modules['pyvista'] = MockVTK()
+# The visualizer imports the individual vtkmodules it uses
+for module_name in ['vtkmodules', 'vtkmodules.vtkInteractionStyle', 'vtkmodules.vtkRenderingFreeType',
+                    'vtkmodules.vtkRenderingOpenGL2', 'vtkmodules.vtkRenderingVolumeOpenGL2',
+                    'vtkmodules.vtkCommonCore', 'vtkmodules.vtkCommonDataModel', 'vtkmodules.vtkFiltersCore',
+                    'vtkmodules.vtkFiltersGeometry', 'vtkmodules.vtkIOImage', 'vtkmodules.vtkRenderingAnnotation',
+                    'vtkmodules.vtkRenderingCore', 'vtkmodules.vtkRenderingLOD', 'vtkmodules.vtkRenderingVolume',
+                    'vtkmodules.qt', 'vtkmodules.qt.QVTKRenderWindowInteractor', 'vtkmodules.util',
+                    'vtkmodules.util.numpy_support', 'pyvista']:
+    sys.modules[module_name] = MockVTK(module_name)
 
 # Now import the control panel
 from qt_dam_visualizer import ControlPanel
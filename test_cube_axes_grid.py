@@ -63,7 +63,6 @@ class VTKCubeAxesTest(QMainWindow):
         
         # Initialize
         self.interactor.Initialize()
-        self.interactor.Start()
         
         # Add initial content
         self.setup_initial_scene()
@@ -39,7 +39,6 @@ class SimpleVolumeTest(QMainWindow):
         self.load_test_volume()
         
         self.interactor.Initialize()
-        self.interactor.Start()
     
     def load_test_volume(self):
         """Load a test volume"""
@@ -49,12 +48,9 @@ class SimpleVolumeTest(QMainWindow):
             print("Test data location not found")
             return
         
-        # Find first VTK file
-        vtk_file = None
-        for file in os.listdir(data_location):
-            if file.startswith("dcinv") and file.endswith(".vtk"):
-                vtk_file = os.path.join(data_location, file)
-                break
+        # Find first VTK file, frame numbers are parsed with the shared precompiled pattern
+        vtk_files = dvu.find_vtk_files(data_location)
+        vtk_file = os.path.join(data_location, next(iter(vtk_files.values()))) if vtk_files else None
         
         if not vtk_file:
             print("No VTK files found")
@@ -82,9 +78,14 @@ class SimpleVolumeTest(QMainWindow):
             print(f"Resampled bounds: {resampled.bounds}")
             print(f"Resampled type: {type(resampled)}")
             
-            # Create simple volume
-            mapper = vtk.vtkSmartVolumeMapper()
+            # Create simple volume with the GPU ray caster, as in the main application
+            mapper = vtk.vtkGPUVolumeRayCastMapper()
             mapper.SetInputData(resampled)
+            mapper.SetBlendModeToComposite()
+            
+            # Fixed sample distance of half the smallest voxel spacing instead of adaptive sampling
+            mapper.SetAutoAdjustSampleDistances(False)
+            mapper.SetSampleDistance(min(resampled.spacing) / 2)
             
             # Simple volume property
             volume_property = vtk.vtkVolumeProperty()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Tests for the pure helpers in damvis_utils"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import damvis_utils as dvu
+
+
+# create_uniform_grid
+
+def test_uniform_grid_covers_bounds():
+    bounds = (2.0, 17.0, 2.0, 22.0, 22.0, 27.0)
+    grid = dvu.create_uniform_grid(bounds, target_cells=500_000)
+    
+    assert grid.origin == pytest.approx(bounds[::2])
+    upper = np.array(grid.origin) + np.array(grid.spacing) * (np.array(grid.dimensions) - 1)
+    assert upper == pytest.approx(bounds[1::2])
+
+def test_uniform_grid_aligns_only_with_small_inflation():
+    # Natural point counts for these bounds are 106 x 140 x 36. The first two
+    # round up to 112 and 144 within the inflation limit, 36 would need 48
+    grid = dvu.create_uniform_grid((2.0, 17.0, 2.0, 22.0, 22.0, 27.0), target_cells=500_000)
+    
+    assert grid.dimensions == (112, 144, 36)
+    assert grid.n_cells == pytest.approx(500_000, rel=0.15)
+
+def test_uniform_grid_spacing_stays_near_isotropic():
+    grid = dvu.create_uniform_grid((0.0, 30.0, 0.0, 1.0, 0.0, 1.0), target_cells=100_000)
+    
+    spacing = np.array(grid.spacing)
+    assert spacing.max() / spacing.min() < 1.0 + dvu.GRID_ALIGNMENT_MAX_INFLATION
+
+@pytest.mark.parametrize("bounds", [(0.0, 1.0, 0.0, 1.0, 0.0, 0.0), (0.0, 1.0, 2.0, 1.0, 0.0, 1.0)])
+def test_uniform_grid_rejects_flat_bounds(bounds):
+    with pytest.raises(ValueError):
+        dvu.create_uniform_grid(bounds)
+
+
+# quantize_to_uint8
+
+def test_quantize_maps_and_clips():
+    data = np.array([-1.0, 0.0, 0.5, 1.0, 2.0], dtype=np.float32)
+    
+    assert dvu.quantize_to_uint8(data, 0.0, 1.0).tolist() == [0, 0, 127, 255, 255]
+
+def test_quantize_nan_and_inf():
+    data = np.array([np.nan, -np.inf, np.inf], dtype=np.float32)
+    
+    assert dvu.quantize_to_uint8(data, 0.0, 1.0).tolist() == [0, 0, 255]
+
+def test_quantize_empty_range():
+    data = np.array([1.0, 1.5, 2.0])
+    
+    assert dvu.quantize_to_uint8(data, 1.0, 1.0).tolist() == [0, 127, 255]
+
+def test_quantize_non_finite_range():
+    with pytest.raises(ValueError):
+        dvu.quantize_to_uint8(np.zeros(4), float('inf'), float('-inf'))
+
+def test_quantize_blocks_and_out_reuse():
+    # Two full blocks and a partial one, written into a reused (z, y, x) buffer
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-0.5, 1.5, size=2 * dvu.QUANTIZE_BLOCK + 1234)
+    expected = np.clip((data.astype(np.float32) - 0.0) * 255.0, 0.0, 255.0).astype(np.uint8)
+    
+    out = np.full((1, 1, data.size), 7, dtype=np.uint8)
+    result = dvu.quantize_to_uint8(data, 0.0, 1.0, out=out)
+    
+    assert result is out
+    np.testing.assert_array_equal(out.ravel(), expected)
+    
+    dvu.quantize_to_uint8(data[::-1].copy(), 0.0, 1.0, out=out)
+    np.testing.assert_array_equal(out.ravel(), expected[::-1])
+
+
+# slab_value_ranges
+
+def test_slab_ranges_match_brute_force():
+    volume = np.random.default_rng(1).integers(0, 256, size=(5, 6, 7), dtype=np.uint8)
+    nz, ny, nx = volume.shape
+    
+    (x_min, x_max), (y_min, y_max), (z_min, z_max) = dvu.slab_value_ranges(volume)
+    
+    assert x_min.tolist() == [volume[:, :, i].min() for i in range(nx)]
+    assert x_max.tolist() == [volume[:, :, i].max() for i in range(nx)]
+    assert y_min.tolist() == [volume[:, j, :].min() for j in range(ny)]
+    assert y_max.tolist() == [volume[:, j, :].max() for j in range(ny)]
+    assert z_min.tolist() == [volume[k].min() for k in range(nz)]
+    assert z_max.tolist() == [volume[k].max() for k in range(nz)]
+
+
+# resample_cache_path
+
+def test_cache_path_keying(tmp_path):
+    file_path = tmp_path / "dcinv.result_1.vtk"
+    file_path.write_text("")
+    bounds = (2, 17, 2, 22, 22, 27)
+    path = dvu.resample_cache_path(str(file_path), bounds, 1000)
+    
+    assert path == dvu.resample_cache_path(str(file_path), [float(b) for b in bounds], 1000)
+    assert os.path.dirname(path) == dvu.CACHE_DIR
+    assert path != dvu.resample_cache_path(str(file_path), (2, 17, 2, 22, 22, 26), 1000)
+    assert path != dvu.resample_cache_path(str(file_path), bounds, 2000)
+    assert path != dvu.resample_cache_path(str(file_path), bounds, 1000, cleanup=True)
+    
+    st = os.stat(file_path)
+    os.utime(file_path, (st.st_atime, st.st_mtime + 10))
+    assert path != dvu.resample_cache_path(str(file_path), bounds, 1000)
+
+
+# find_vtk_files
+
+def test_find_vtk_files_sorted_and_prefers_vtu(tmp_path):
+    for name in ["dcinv.result_10.vtk", "dcinv.result_2.vtk", "dcinv.result_2.vtu", "dcinv.result_1.vtk",
+                 "other_3.vtk", "dcinv.result_4.txt"]:
+        (tmp_path / name).write_text("")
+    
+    files = dvu.find_vtk_files(str(tmp_path))
+    
+    assert list(files) == [1, 2, 10]
+    assert files == {1: "dcinv.result_1.vtk", 2: "dcinv.result_2.vtu", 10: "dcinv.result_10.vtk"}